@@ -21,7 +21,22 @@ env = environ.Env(
     API_BASE=(str, 'https://pokeapi.co/api/v2'),
     IMPORT_POKEDEX_ON_STARTUP=(bool, False),
     IMPORT_POKEDEX_LIMIT=(int, 100),
+    IMPORT_POKEDEX_IN_BACKGROUND=(bool, False),
+    IMPORT_RUN_STALE_AFTER=(int, 900),
     ALLOWED_HOSTS=(list, []),
+    SNAPSHOT_DIR=(str, str(BASE_DIR / 'snapshots')),
+    SPRITE_CACHE=(bool, False),
+    SPRITE_ROOT=(str, str(BASE_DIR / 'sprites')),
+    EVOLUTION_CHAIN_RAW=(bool, False),
+    COMPRESSED_CACHE_ENTRIES=(int, 5000),
+    QUERY_BUDGET_STRICT=(bool, False),
+    PERFORMANCE_LOG_LEVEL=(str, 'WARNING'),
+    SQLITE_PATH=(str, str(BASE_DIR / 'db.sqlite3')),
+    CONN_MAX_AGE=(int, 0),
+    SQLITE_TUNING=(bool, False),
+    SQLITE_BUSY_TIMEOUT=(int, 20),
+    SQLITE_MMAP_SIZE=(int, 256 * 1024 * 1024),
+    SQLITE_CACHE_SIZE=(int, -64000),
 )
 environ.Env.read_env(BASE_DIR / '.env')
 
@@ -30,6 +45,13 @@ API_BASE = env('API_BASE')
 ALLOWED_HOSTS = env('ALLOWED_HOSTS')
 IMPORT_POKEDEX_ON_STARTUP = env('IMPORT_POKEDEX_ON_STARTUP')
 IMPORT_POKEDEX_LIMIT = env('IMPORT_POKEDEX_LIMIT')
+IMPORT_POKEDEX_IN_BACKGROUND = env('IMPORT_POKEDEX_IN_BACKGROUND')
+# Seconds without progress after which an unfinished import run is considered dead.
+IMPORT_RUN_STALE_AFTER = env('IMPORT_RUN_STALE_AFTER')
+SNAPSHOT_DIR = Path(env('SNAPSHOT_DIR'))
+SPRITE_CACHE = env('SPRITE_CACHE')
+SPRITE_ROOT = Path(env('SPRITE_ROOT'))
+EVOLUTION_CHAIN_RAW = env('EVOLUTION_CHAIN_RAW')
 
 
 # Quick-start development settings - unsuitable for production
@@ -53,6 +75,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'pokedex.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -60,9 +83,84 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'pokedex.middleware.WhiteNoiseMiddleware',
+    'pokedex.middleware.CompressionMiddleware',
 ]
 
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'pokedex.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# Maximum SQL queries per request, by URL name. Exceeding a budget logs a warning,
+# or raises when QUERY_BUDGET_STRICT is on. Detail and compare are served from
+# pre-encoded payloads in one query; the budgets cover the fallback used when the
+# stored payloads are missing or from an older dataset version. The dataset
+# version lookup of CompressionMiddleware is not counted.
+QUERY_BUDGETS = {
+    'api-bootstrap': 5,
+    'api-pokemon-list': 2,
+    'api-pokemon-detail': 4,
+    'api-pokemon-compare': 5,
+    'api-type-list': 1,
+    'api-ability-list': 1,
+    'api-import-status': 3,
+    'api-async-pokemon-list': 2,
+    'api-async-pokemon-detail': 4,
+    'api-async-pokemon-compare': 5,
+    'api-async-type-list': 1,
+    'api-async-ability-list': 1,
+}
+QUERY_BUDGET_STRICT = env('QUERY_BUDGET_STRICT')
+
+# Views whose JSON only changes with the dataset version. CompressionMiddleware
+# caches their brotli and gzip variants per dataset version in the
+# COMPRESSED_RESPONSE_CACHE cache.
+COMPRESSED_VIEWS = {
+    'api-bootstrap',
+    'api-pokemon-list',
+    'api-pokemon-detail',
+    'api-pokemon-compare',
+    'api-type-list',
+    'api-ability-list',
+    'api-async-pokemon-list',
+    'api-async-pokemon-detail',
+    'api-async-pokemon-compare',
+    'api-async-type-list',
+    'api-async-ability-list',
+}
+COMPRESSION_MIN_SIZE = 200
+COMPRESSED_RESPONSE_CACHE = 'compressed'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'compressed': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'compressed-responses',
+        'OPTIONS': {'MAX_ENTRIES': env('COMPRESSED_CACHE_ENTRIES')},
+    },
+}
+
+# Per-request timing lines are logged at INFO; budget overruns at WARNING.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'pokedex.performance': {
+            'handlers': ['console'],
+            'level': env('PERFORMANCE_LOG_LEVEL'),
+            'propagate': False,
+        },
+    },
+}
+
 ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
@@ -90,10 +188,31 @@ WSGI_APPLICATION = 'core.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': Path(env('SQLITE_PATH')),
+        'CONN_MAX_AGE': env('CONN_MAX_AGE'),
+        'CONN_HEALTH_CHECKS': env('CONN_MAX_AGE') != 0,
+        'OPTIONS': {
+            # Seconds a connection waits on a locked database before raising.
+            'timeout': env('SQLITE_BUSY_TIMEOUT'),
+        },
     }
 }
 
+# Production profile for SQLite: WAL lets readers keep going while the importer
+# writes, IMMEDIATE transactions take the write lock up front instead of failing
+# on lock upgrade, and the mmap/cache pragmas keep hot pages in memory.
+if env('SQLITE_TUNING'):
+    DATABASES['default']['OPTIONS'].update({
+        'transaction_mode': 'IMMEDIATE',
+        'init_command': ';'.join([
+            'PRAGMA journal_mode=WAL',
+            'PRAGMA synchronous=NORMAL',
+            f"PRAGMA mmap_size={env('SQLITE_MMAP_SIZE')}",
+            f"PRAGMA cache_size={env('SQLITE_CACHE_SIZE')}",
+            'PRAGMA temp_store=MEMORY',
+        ]),
+    })
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
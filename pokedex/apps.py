@@ -2,10 +2,20 @@
 
 import os
 import sys
+import threading
 
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.management import call_command
+from django.db import connections
+
+
+def _run_import():
+    """Run the import command and release this thread's database connections."""
+    try:
+        call_command('import_pokedex', f'--limit={settings.IMPORT_POKEDEX_LIMIT}')
+    finally:
+        connections.close_all()
 
 
 class PokedexConfig(AppConfig):
@@ -19,9 +29,10 @@ class PokedexConfig(AppConfig):
         Trigger Pokédex import on server startup.
 
         Checks the IMPORT_POKEDEX_ON_STARTUP setting and that the
-        `runserver` command is being used. If the database has no
-        Pokémon entries, runs the `import_pokedex` management command
-        with the configured limit.
+        `runserver` command is being used, then runs the `import_pokedex`
+        management command with the configured limit. With
+        IMPORT_POKEDEX_IN_BACKGROUND the import runs in a daemon thread so the
+        server starts serving the data already present right away.
         """
         if not settings.IMPORT_POKEDEX_ON_STARTUP:
             return
@@ -30,4 +41,7 @@ class PokedexConfig(AppConfig):
         if os.environ.get('RUN_MAIN') != 'true':
             return
 
-        call_command('import_pokedex', f'--limit={settings.IMPORT_POKEDEX_LIMIT}')
\ No newline at end of file
+        if settings.IMPORT_POKEDEX_IN_BACKGROUND:
+            threading.Thread(target=_run_import, name='pokedex-import', daemon=True).start()
+        else:
+            _run_import()
@@ -0,0 +1,9 @@
+"""Import benchmark helpers."""
+from .database import use_database
+from .endpoints import read_api_endpoints
+from .load import run_load
+from .revision import git_commit
+from .seed import seed_pokedex
+from .servers import run_server
+from .stats import LatencyRecorder, summarize
+from .stub_pokeapi import StubPokeAPI
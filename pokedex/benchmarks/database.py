@@ -0,0 +1,14 @@
+"""Module for pointing a benchmark process at its own SQLite database."""
+from django.core.management import call_command
+from django.db import connection
+
+
+def use_database(path):
+    """
+    Switch the default connection of this process to the SQLite file at `path` and migrate it.
+
+    :param path: SQLite file to use; created if it does not exist.
+    """
+    connection.close()
+    connection.settings_dict['NAME'] = str(path)
+    call_command('migrate', verbosity=0, interactive=False)
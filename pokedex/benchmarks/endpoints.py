@@ -0,0 +1,42 @@
+"""Module building the request mix used to benchmark the read API."""
+from urllib.parse import urlencode
+
+from pokedex.models import Ability, Move, Pokemon, Type
+
+
+def read_api_endpoints(prefix='/api/', sample_size=20):
+    """
+    Build benchmark request paths for the read API from the data in the database.
+
+    :param prefix: URL prefix of the API (``/api/`` for DRF, ``/api/async/`` for async views).
+    :param sample_size: Number of distinct Pokémon to request details/comparisons for.
+    :return: Dict mapping an endpoint label to a list of request paths.
+    """
+    ids = list(Pokemon.objects.values_list('id', flat=True)[:sample_size])
+    total = Pokemon.objects.count()
+    type_name = Type.objects.values_list('name', flat=True).first()
+    ability_name = Ability.objects.values_list('name', flat=True).first()
+    move_name = Move.objects.values_list('name', flat=True).first()
+    deep_page = max(1, total // 20)
+
+    def list_path(**params):
+        return f'{prefix}pokemon/?{urlencode({"limit": 20, **params})}'
+
+    endpoints = {
+        'list': [list_path(page=1)],
+        'list_search': [list_path(page=1, search='a')],
+        'list_deep_page': [list_path(page=deep_page)],
+        'detail': [f'{prefix}pokemon/{pid}/' for pid in ids],
+        'compare': [
+            f'{prefix}pokemon/compare/?id1={a}&id2={b}' for a, b in zip(ids, reversed(ids))
+        ],
+        'types': [f'{prefix}types/'],
+        'abilities': [f'{prefix}abilities/'],
+    }
+    if type_name:
+        endpoints['list_type'] = [list_path(page=1, type=type_name)]
+    if ability_name:
+        endpoints['list_ability'] = [list_path(page=1, ability=ability_name)]
+    if move_name:
+        endpoints['list_move'] = [list_path(page=1, move=move_name)]
+    return endpoints
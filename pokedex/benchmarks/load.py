@@ -0,0 +1,84 @@
+"""Module with a small threaded HTTP load generator for benchmarking the API."""
+import http.client
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .stats import LatencyRecorder
+
+
+def run_load(base_url, endpoints, duration=10.0, concurrency=8, on_response=None):
+    """
+    Drive GET requests against a running server and measure latency.
+
+    Each worker thread keeps one persistent HTTP connection and cycles through
+    the request mix, starting at a different offset. Endpoints are interleaved
+    so each label gets an equal share of requests regardless of how many
+    paths it has.
+
+    :param base_url: Server root, e.g. ``http://127.0.0.1:8000``.
+    :param endpoints: Dict mapping an endpoint label to a list of request paths.
+    :param duration: Seconds to keep sending requests.
+    :param concurrency: Number of concurrent client threads.
+    :param on_response: Optional callback ``(label, response)`` called for each response.
+    :return: Dict with an ``overall`` summary and one summary per endpoint label.
+    """
+    parts = urlsplit(base_url)
+    rounds = max(len(paths) for paths in endpoints.values())
+    requests = [
+        (label, paths[i % len(paths)])
+        for i in range(rounds)
+        for label, paths in endpoints.items()
+    ]
+    overall = LatencyRecorder()
+    per_endpoint = {label: LatencyRecorder() for label in endpoints}
+    deadline = time.perf_counter() + duration
+
+    def worker(offset):
+        conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+        cycle = itertools.islice(itertools.cycle(requests), offset, None)
+        try:
+            for label, path in cycle:
+                if time.perf_counter() >= deadline:
+                    break
+                started = time.perf_counter()
+                try:
+                    conn.request('GET', path)
+                    response = conn.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+                    overall.record_error()
+                    per_endpoint[label].record_error()
+                    continue
+                latency = time.perf_counter() - started
+                if response.status >= 400:
+                    overall.record_error()
+                    per_endpoint[label].record_error()
+                    continue
+                overall.record(latency)
+                per_endpoint[label].record(latency)
+                if on_response:
+                    on_response(label, response)
+        finally:
+            conn.close()
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=worker, args=(i * len(requests) // concurrency,))
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_time = time.perf_counter() - started
+
+    return {
+        'concurrency': concurrency,
+        'wall_time_s': round(wall_time, 3),
+        'overall': overall.summary(wall_time),
+        'endpoints': {label: rec.summary(wall_time) for label, rec in per_endpoint.items()},
+    }
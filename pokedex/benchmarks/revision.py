@@ -0,0 +1,15 @@
+"""Module for tagging benchmark reports with the code revision they were run against."""
+import subprocess
+
+from django.conf import settings
+
+
+def git_commit():
+    """Return the git commit of the project checkout, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,70 @@
+"""Module for starting application servers as subprocesses during benchmarks."""
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+
+SERVER_COMMANDS = {
+    'wsgi': [
+        sys.executable, '-m', 'gunicorn', 'core.wsgi:application',
+        '--bind', '127.0.0.1:{port}', '--workers', '{workers}',
+    ],
+    'asgi': [
+        sys.executable, '-m', 'uvicorn', 'core.asgi:application',
+        '--host', '127.0.0.1', '--port', '{port}', '--workers', '{workers}',
+        '--no-access-log',
+    ],
+}
+
+
+def free_port():
+    """Return a TCP port that is currently free on localhost."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, process, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited early with code {process.returncode}')
+        with contextlib.suppress(OSError), socket.create_connection(('127.0.0.1', port), 0.2):
+            return
+        time.sleep(0.1)
+    raise RuntimeError(f'Server did not start listening on port {port} in {timeout}s')
+
+
+@contextlib.contextmanager
+def run_server(kind, workers=1, env=None, timeout=30):
+    """
+    Run gunicorn (``wsgi``) or uvicorn (``asgi``) on a free port for the block's duration.
+
+    :param kind: ``'wsgi'`` or ``'asgi'``.
+    :param workers: Number of server worker processes.
+    :param env: Extra environment variables for the server process.
+    :param timeout: Seconds to wait for the server to accept connections.
+    :return: Context manager yielding the server's base URL.
+    """
+    port = free_port()
+    command = [part.format(port=port, workers=workers) for part in SERVER_COMMANDS[kind]]
+    process = subprocess.Popen(
+        command,
+        cwd=settings.BASE_DIR,
+        env={'ALLOWED_HOSTS': '127.0.0.1', **os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_port(port, process, timeout)
+        yield f'http://127.0.0.1:{port}'
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
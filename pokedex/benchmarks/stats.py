@@ -0,0 +1,62 @@
+"""Module with helpers for summarizing benchmark latency samples."""
+import threading
+
+
+def _percentile(sorted_values, pct):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, wall_time=None, errors=0):
+    """
+    Summarize latency samples into a JSON-serializable dict.
+
+    :param latencies: Iterable of request latencies in seconds.
+    :param wall_time: Total wall time in seconds, used to compute throughput.
+    :param errors: Number of failed operations.
+    :return: Dict with count, errors, throughput and p50/p95/p99/max in milliseconds.
+    """
+    values = sorted(latencies)
+
+    def ms(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    summary = {
+        'count': len(values),
+        'errors': errors,
+        'p50_ms': ms(_percentile(values, 50)),
+        'p95_ms': ms(_percentile(values, 95)),
+        'p99_ms': ms(_percentile(values, 99)),
+        'max_ms': ms(values[-1] if values else None),
+    }
+    if wall_time:
+        summary['throughput_rps'] = round(len(values) / wall_time, 2)
+    return summary
+
+
+class LatencyRecorder:
+    """Thread-safe collector of latency samples and error counts."""
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+
+    def record(self, latency):
+        """Record a successful operation that took `latency` seconds."""
+        with self._lock:
+            self.latencies.append(latency)
+
+    def record_error(self):
+        """Record a failed operation."""
+        with self._lock:
+            self.errors += 1
+
+    def summary(self, wall_time=None):
+        """Return the summary of all recorded samples (see `summarize`)."""
+        with self._lock:
+            return summarize(self.latencies, wall_time=wall_time, errors=self.errors)
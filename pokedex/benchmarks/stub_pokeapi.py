@@ -0,0 +1,257 @@
+"""
+Module with a local stand-in for the PokéAPI, for offline importer benchmarks and tests.
+
+The stub serves the endpoints the importer uses (``/pokemon?limit=1``,
+``/pokemon/<id>``, ``/pokemon-species/<id>/``, ``/evolution-chain/<id>/``)
+plus sprite images. Payloads are synthetic and deterministic, or replayed from
+a directory of recorded responses. Latency, server errors and 429 responses
+can be injected to exercise the client's retry behaviour.
+"""
+import io
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from PIL import Image
+
+from .seed import STAT_NAMES, SYLLABLES, TYPE_NAMES
+
+UPSTREAM_BASE = 'https://pokeapi.co/api/v2'
+CHAIN_LENGTH = 3
+ROUTES = [
+    ('count', re.compile(r'^/api/v2/pokemon/?$')),
+    ('pokemon', re.compile(r'^/api/v2/pokemon/(\d+)/?$')),
+    ('species', re.compile(r'^/api/v2/pokemon-species/(\d+)/?$')),
+    ('evolution', re.compile(r'^/api/v2/evolution-chain/(\d+)/?$')),
+    ('sprite', re.compile(r'^/sprites/(\d+)\.png$')),
+]
+RECORDED_PATHS = {
+    'pokemon': 'pokemon/{}.json',
+    'species': 'pokemon-species/{}.json',
+    'evolution': 'evolution-chain/{}.json',
+}
+
+
+class StubPokeAPI:
+    """
+    Threaded HTTP server imitating the parts of the PokéAPI the importer needs.
+
+    Use as a context manager; ``api_base`` is the value to pass as the client's
+    base URL. Counters of served and injected responses are kept in ``stats``.
+    """
+
+    def __init__(
+        self, count=151, latency=0.0, error_rate=0.0, rate_limit_rate=0.0, moves=40,
+        recordings=None, seed=0,
+    ):
+        """
+        Configure the stub.
+
+        :param count: Number of Pokémon reported and served.
+        :param latency: Seconds to sleep before answering each request.
+        :param error_rate: Fraction of requests answered with HTTP 503.
+        :param rate_limit_rate: Fraction of requests answered with HTTP 429.
+        :param moves: Number of move entries in each synthetic `/pokemon` payload.
+        :param recordings: Directory of recorded responses (``pokemon/1.json``,
+            ``pokemon-species/1.json``, ``evolution-chain/1.json``) served instead
+            of synthetic data when present.
+        :param seed: Random seed for synthetic data and fault injection.
+        """
+        self.count = count
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.moves = moves
+        self.recordings = Path(recordings) if recordings else None
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors_injected': 0, 'rate_limited': 0}
+        self._server = None
+        self._thread = None
+        self._sprite = None
+
+    @property
+    def base_url(self):
+        """Root URL of the running stub."""
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def api_base(self):
+        """API base URL to configure the PokéAPI client with."""
+        return f'{self.base_url}/api/v2'
+
+    def start(self):
+        """Start serving on a free localhost port in a background thread."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # noqa: N802 - name required by BaseHTTPRequestHandler
+                status, body, content_type, headers = stub.handle(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        """Start the stub when entering a `with` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stop the stub when leaving a `with` block."""
+        self.stop()
+
+    def handle(self, raw_path):
+        """
+        Build the response for a request path.
+
+        :return: Tuple of (status, body bytes, content type, extra headers).
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+            roll = self._rng.random()
+        if self.latency:
+            time.sleep(self.latency)
+
+        if roll < self.rate_limit_rate:
+            with self._lock:
+                self.stats['rate_limited'] += 1
+            return 429, b'Too Many Requests', 'text/plain', {'Retry-After': '0'}
+        if roll < self.rate_limit_rate + self.error_rate:
+            with self._lock:
+                self.stats['errors_injected'] += 1
+            return 503, b'Service Unavailable', 'text/plain', {}
+
+        path = urlsplit(raw_path).path
+        for route, pattern in ROUTES:
+            match = pattern.match(path)
+            if not match:
+                continue
+            if route == 'count':
+                return self._json({'count': self.count, 'results': []})
+            pk = int(match.group(1))
+            if route == 'sprite':
+                return 200, self._sprite_bytes(), 'image/png', {}
+            if route != 'evolution' and not 1 <= pk <= self.count:
+                break
+            recorded = self._recorded(route, pk)
+            if recorded is not None:
+                return 200, recorded, 'application/json', {}
+            return self._json(getattr(self, f'_{route}_payload')(pk))
+        return 404, b'{"detail": "Not found."}', 'application/json', {}
+
+    def _json(self, data):
+        return 200, json.dumps(data).encode(), 'application/json', {}
+
+    def _recorded(self, route, pk):
+        if not self.recordings:
+            return None
+        path = self.recordings / RECORDED_PATHS[route].format(pk)
+        if not path.is_file():
+            return None
+        return path.read_bytes().replace(UPSTREAM_BASE.encode(), self.api_base.encode())
+
+    def _sprite_bytes(self):
+        if self._sprite is None:
+            buffer = io.BytesIO()
+            Image.new('RGBA', (96, 96), (200, 60, 60, 255)).save(buffer, format='PNG')
+            self._sprite = buffer.getvalue()
+        return self._sprite
+
+    def _name(self, pk):
+        rng = random.Random(self.seed * 100003 + pk)
+        return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))) + f'-{pk}'
+
+    def _named(self, kind, name):
+        return {'name': name, 'url': f'{self.api_base}/{kind}/{name}/'}
+
+    def _species(self, pk):
+        return {'name': self._name(pk), 'url': f'{self.api_base}/pokemon-species/{pk}/'}
+
+    def _pokemon_payload(self, pk):
+        rng = random.Random(self.seed * 100003 + pk)
+        return {
+            'id': pk,
+            'name': self._name(pk),
+            'height': rng.randint(1, 200),
+            'weight': rng.randint(1, 9999),
+            'base_experience': rng.randint(36, 390),
+            'sprites': {'front_default': f'{self.base_url}/sprites/{pk}.png'},
+            'species': self._species(pk),
+            'types': [
+                {'slot': slot, 'type': self._named('type', name)}
+                for slot, name in enumerate(rng.sample(TYPE_NAMES, rng.choice((1, 2))), 1)
+            ],
+            'abilities': [
+                {'slot': slot, 'is_hidden': slot == 3,
+                 'ability': self._named('ability', f'ability-{rng.randint(1, 300)}')}
+                for slot in range(1, rng.choice((2, 3, 4)))
+            ],
+            'stats': [
+                {'base_stat': rng.randint(5, 255), 'effort': 0, 'stat': self._named('stat', name)}
+                for name in STAT_NAMES
+            ],
+            'moves': [
+                {
+                    'move': self._named('move', f'move-{rng.randint(1, 900)}'),
+                    'version_group_details': [{
+                        'level_learned_at': rng.choice((0, rng.randint(1, 100))),
+                        'move_learn_method': self._named(
+                            'move-learn-method', rng.choice(('level-up', 'machine', 'egg'))
+                        ),
+                        'version_group': self._named('version-group', 'scarlet-violet'),
+                    }],
+                }
+                for _ in range(self.moves)
+            ],
+        }
+
+    def _species_payload(self, pk):
+        chain_id = (pk - 1) // CHAIN_LENGTH + 1
+        return {
+            'id': pk,
+            'name': self._name(pk),
+            'evolution_chain': {'url': f'{self.api_base}/evolution-chain/{chain_id}/'},
+        }
+
+    def _evolution_payload(self, chain_id):
+        first = (chain_id - 1) * CHAIN_LENGTH + 1
+        ids = [pk for pk in range(first, first + CHAIN_LENGTH) if pk <= self.count]
+        node = None
+        for pk in reversed(ids):
+            node = {
+                'species': self._species(pk),
+                'evolution_details': [{'trigger': self._named('evolution-trigger', 'level-up'),
+                                       'min_level': 16}] if pk != first else [],
+                'evolves_to': [node] if node else [],
+                'is_baby': False,
+            }
+        return {'id': chain_id, 'baby_trigger_item': None, 'chain': node}
@@ -0,0 +1,167 @@
+"""Module for load-benchmarking the read API against a seeded database."""
+import json
+import re
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from pokedex.benchmarks import (
+    git_commit,
+    read_api_endpoints,
+    run_load,
+    run_server,
+    seed_pokedex,
+    use_database,
+)
+from pokedex.models import DatasetVersion, Pokemon
+from pokedex.services.payloads import store_payloads
+
+QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+API_PREFIXES = {'wsgi': '/api/', 'asgi': '/api/async/'}
+
+
+class _QueryCounter:
+    """Collect SQL query counts reported in Server-Timing headers, per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = defaultdict(list)
+
+    def __call__(self, label, response):
+        match = QUERIES_RE.search(response.getheader('Server-Timing') or '')
+        if match:
+            with self._lock:
+                self.counts[label].append(int(match.group(1)))
+
+    def average(self, label):
+        values = self.counts.get(label)
+        return round(sum(values) / len(values), 2) if values else None
+
+
+class Command(BaseCommand):
+    """Django management command running a reproducible HTTP load benchmark of the read API."""
+
+    help = (
+        'Seed a separate SQLite database with synthetic Pokémon, serve it with gunicorn '
+        '(or uvicorn) and report p50/p95/p99 latency, throughput and queries per request '
+        'for each read endpoint as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the dataset size, server and load shape.
+
+        :param parser: ArgumentParser instance to which arguments are added.
+        """
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=1000,
+            help='Number of synthetic Pokémon to seed (default=1000)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for the synthetic data (default=0)'
+        )
+        parser.add_argument(
+            '--database',
+            help='SQLite file to benchmark against; seeded only if empty (default=temporary file)'
+        )
+        parser.add_argument(
+            '--server',
+            choices=sorted(API_PREFIXES),
+            default='wsgi',
+            help='Serve with gunicorn core.wsgi or uvicorn core.asgi (default=wsgi)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Server worker processes (default=1)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='Concurrent client connections (default=8)'
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10.0,
+            help='Seconds of measured load (default=10)'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=float,
+            default=1.0,
+            help='Seconds of unmeasured load before measuring (default=1)'
+        )
+        parser.add_argument(
+            '--output',
+            help='Also write the JSON report to this file'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Seed the benchmark database, run the load and print the JSON report.
+
+        :param args: Positional arguments (unused).
+        :param options: Dictionary of command options.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = options['database'] or str(Path(tmp_dir) / 'benchmark.sqlite3')
+            seed_seconds = self._prepare_database(db_path, options)
+
+            endpoints = read_api_endpoints(prefix=API_PREFIXES[options['server']])
+            size = Pokemon.objects.count()
+            connection.close()
+
+            queries = _QueryCounter()
+            env = {'SQLITE_PATH': db_path, 'QUERY_BUDGET_STRICT': 'False'}
+            with run_server(options['server'], workers=options['workers'], env=env) as base_url:
+                if options['warmup']:
+                    run_load(base_url, endpoints, options['warmup'], options['concurrency'])
+                results = run_load(
+                    base_url,
+                    endpoints,
+                    duration=options['duration'],
+                    concurrency=options['concurrency'],
+                    on_response=queries,
+                )
+
+        for label, summary in results['endpoints'].items():
+            summary['queries_per_request'] = queries.average(label)
+
+        report = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'size': size,
+            'seed': options['seed'],
+            'seed_seconds': seed_seconds,
+            'server': options['server'],
+            'workers': options['workers'],
+            **results,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            Path(options['output']).write_text(output)
+        self.stdout.write(output)
+
+    def _prepare_database(self, db_path, options):
+        """Point this process at the benchmark database, migrate it and seed it if empty."""
+        use_database(db_path)
+        if Pokemon.objects.exists():
+            return None
+        started = time.perf_counter()
+        with transaction.atomic():
+            seed_pokedex(options['size'], seed=options['seed'])
+            store_payloads(DatasetVersion.current())
+        return round(time.perf_counter() - started, 3)
@@ -0,0 +1,141 @@
+"""Module for benchmarking read latency while the importer is writing to the database."""
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, transaction
+from django.db.models import F
+
+from pokedex.benchmarks import LatencyRecorder
+from pokedex.models import Pokemon, PokemonStat, Type
+
+
+class Command(BaseCommand):
+    """Django management command measuring list-query latency with and without a writer."""
+
+    help = (
+        'Measure list-query latency in the configured database, first idle and then '
+        'while a writer thread replays import-style transactions.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the benchmark duration and concurrency.
+
+        :param parser: ArgumentParser instance to which arguments are added.
+        """
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=5.0,
+            help='Seconds to run each phase (default=5)'
+        )
+        parser.add_argument(
+            '--readers',
+            type=int,
+            default=4,
+            help='Number of concurrent reader threads (default=4)'
+        )
+        parser.add_argument(
+            '--batch',
+            type=int,
+            default=50,
+            help='Pokémon rewritten per writer transaction (default=50)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the idle and contended phases and print a JSON report.
+
+        :param args: Positional arguments (unused).
+        :param options: Dictionary of command options.
+        """
+        pokemon_ids = list(Pokemon.objects.values_list('id', flat=True))
+        if not pokemon_ids:
+            raise CommandError('The database is empty; run import_pokedex first.')
+        type_names = list(Type.objects.values_list('name', flat=True)[:2])
+        connection.close()
+
+        idle = self._run_phase(options, type_names, pokemon_ids, with_writer=False)
+        contended = self._run_phase(options, type_names, pokemon_ids, with_writer=True)
+
+        db = settings.DATABASES['default']
+        report = {
+            'sqlite_tuning': 'init_command' in db.get('OPTIONS', {}),
+            'conn_max_age': db.get('CONN_MAX_AGE'),
+            'readers': options['readers'],
+            'idle': idle,
+            'during_import': contended,
+        }
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def _run_phase(self, options, type_names, pokemon_ids, with_writer):
+        stop = threading.Event()
+        reads = LatencyRecorder()
+        writes = LatencyRecorder()
+
+        threads = [
+            threading.Thread(target=self._reader, args=(stop, reads, type_names))
+            for _ in range(options['readers'])
+        ]
+        if with_writer:
+            threads.append(threading.Thread(
+                target=self._writer, args=(stop, writes, pokemon_ids, options['batch'])
+            ))
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(options['duration'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        wall_time = time.perf_counter() - started
+
+        result = {'reads': reads.summary(wall_time)}
+        if with_writer:
+            result['writes'] = writes.summary(wall_time)
+        return result
+
+    def _reader(self, stop, recorder, type_names):
+        """Issue the list view's count + page queries until stopped."""
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    qs = Pokemon.objects.filter(types__name__in=type_names)
+                    qs.count()
+                    list(qs.values_list('id', 'name')[:20])
+                except OperationalError:
+                    recorder.record_error()
+                    continue
+                recorder.record(time.perf_counter() - started)
+        finally:
+            connection.close()
+
+    def _writer(self, stop, recorder, pokemon_ids, batch):
+        """Rewrite stats of Pokémon in batches, the way the importer does, until stopped."""
+        try:
+            position = 0
+            while not stop.is_set():
+                chunk = pokemon_ids[position:position + batch] or pokemon_ids[:batch]
+                position = (position + batch) % len(pokemon_ids)
+                started = time.perf_counter()
+                try:
+                    with transaction.atomic():
+                        stats = list(PokemonStat.objects.filter(pokemon_id__in=chunk))
+                        PokemonStat.objects.filter(pokemon_id__in=chunk).delete()
+                        for stat in stats:
+                            stat.pk = None
+                        PokemonStat.objects.bulk_create(stats)
+                        Pokemon.objects.filter(id__in=chunk).update(
+                            base_experience=F('base_experience')
+                        )
+                except OperationalError:
+                    recorder.record_error()
+                    continue
+                recorder.record(time.perf_counter() - started)
+        finally:
+            connection.close()
@@ -0,0 +1,140 @@
+"""Module for benchmarking the importer against a local PokéAPI stub."""
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from pokedex.benchmarks import StubPokeAPI, git_commit, use_database
+from pokedex.services import PokeAPIClient, PokedexImporter, SpriteCache
+
+
+class Command(BaseCommand):
+    """Django management command timing a full import from a local PokéAPI stub server."""
+
+    help = (
+        'Serve synthetic (or recorded) PokéAPI data from a local stub with optional latency, '
+        'errors and rate limiting, import it into a separate SQLite database and report '
+        'per-phase timings, requests per second and wall time as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the dataset size and the stub's fault injection.
+
+        :param parser: ArgumentParser instance to which arguments are added.
+        """
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=151,
+            help='Number of Pokémon served by the stub and imported (default=151)'
+        )
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.0,
+            help='Milliseconds the stub waits before each response (default=0)'
+        )
+        parser.add_argument(
+            '--error-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of stub responses that are HTTP 503 (default=0)'
+        )
+        parser.add_argument(
+            '--rate-limit-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of stub responses that are HTTP 429 with Retry-After: 0 (default=0)'
+        )
+        parser.add_argument(
+            '--moves',
+            type=int,
+            default=40,
+            help='Move entries per synthetic /pokemon payload, to mimic real sizes (default=40)'
+        )
+        parser.add_argument(
+            '--recordings',
+            help='Directory of recorded PokéAPI responses served in place of synthetic data'
+        )
+        parser.add_argument(
+            '--sprites',
+            action='store_true',
+            help='Also download sprites and generate thumbnails'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for synthetic data and fault injection (default=0)'
+        )
+        parser.add_argument(
+            '--database',
+            help='SQLite file to import into (default=temporary file)'
+        )
+        parser.add_argument(
+            '--output',
+            help='Also write the JSON report to this file'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Start the stub, run the import and print the JSON report.
+
+        :param args: Positional arguments (unused).
+        :param options: Dictionary of command options.
+        """
+        logging.getLogger('pokedex.services.importer').setLevel(logging.WARNING)
+        stub = StubPokeAPI(
+            count=options['limit'],
+            latency=options['latency'] / 1000,
+            error_rate=options['error_rate'],
+            rate_limit_rate=options['rate_limit_rate'],
+            moves=options['moves'],
+            recordings=options['recordings'],
+            seed=options['seed'],
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir, stub:
+            use_database(options['database'] or Path(tmp_dir) / 'benchmark.sqlite3')
+            client = PokeAPIClient(base_url=stub.api_base, backoff_factor=0)
+            sprite_cache = SpriteCache(Path(tmp_dir) / 'sprites') if options['sprites'] else None
+            importer = PokedexImporter(client=client, sprite_cache=sprite_cache)
+
+            started = time.perf_counter()
+            run = importer.import_range(limit=options['limit'])
+            wall_time = time.perf_counter() - started
+
+        # JSON decoding happens inside the client; count it as parsing, not fetching.
+        timings = dict(importer.timings)
+        timings['fetch'] -= client.decode_seconds
+        timings['parse'] += client.decode_seconds
+        http_requests = stub.stats['requests']
+
+        report = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'limit': options['limit'],
+            'latency_ms': options['latency'],
+            'error_rate': options['error_rate'],
+            'rate_limit_rate': options['rate_limit_rate'],
+            'imported': run.processed,
+            'failed': run.failed,
+            'wall_time_s': round(wall_time, 3),
+            'phases_s': {phase: round(seconds, 3) for phase, seconds in timings.items()},
+            'http_requests': http_requests,
+            'client_requests': client.requests_made,
+            'retries': http_requests - client.requests_made,
+            'injected': {
+                'errors': stub.stats['errors_injected'],
+                'rate_limited': stub.stats['rate_limited'],
+            },
+            'requests_per_second': round(http_requests / wall_time, 1) if wall_time else None,
+            'pokemon_per_second': round(run.processed / wall_time, 1) if wall_time else None,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            Path(options['output']).write_text(output)
+        self.stdout.write(output)
@@ -0,0 +1,76 @@
+"""Module for comparing WSGI (gunicorn) and ASGI (uvicorn) throughput of the read API."""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pokedex.benchmarks import read_api_endpoints, run_load, run_server
+from pokedex.models import Pokemon
+
+DEPLOYMENTS = {
+    # label: (server kind, API prefix)
+    'wsgi_gunicorn': ('wsgi', '/api/'),
+    'asgi_uvicorn': ('asgi', '/api/async/'),
+}
+
+
+class Command(BaseCommand):
+    """Django management command benchmarking the read API under gunicorn and uvicorn."""
+
+    help = (
+        'Start gunicorn (core.wsgi, DRF views) and uvicorn (core.asgi, async views) against '
+        'the configured database and report latency and throughput as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the load shape and server workers.
+
+        :param parser: ArgumentParser instance to which arguments are added.
+        """
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Worker processes per server (default=1)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=16,
+            help='Concurrent client connections (default=16)'
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10.0,
+            help='Seconds of load per deployment (default=10)'
+        )
+        parser.add_argument(
+            '--only',
+            choices=sorted(DEPLOYMENTS),
+            help='Benchmark a single deployment'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the load against each deployment in turn and print a JSON report.
+
+        :param args: Positional arguments (unused).
+        :param options: Dictionary of command options.
+        """
+        if not Pokemon.objects.exists():
+            raise CommandError('The database is empty; run import_pokedex first.')
+
+        report = {'workers': options['workers'], 'deployments': {}}
+        for label, (kind, prefix) in DEPLOYMENTS.items():
+            if options['only'] and options['only'] != label:
+                continue
+            endpoints = read_api_endpoints(prefix=prefix)
+            with run_server(kind, workers=options['workers']) as base_url:
+                report['deployments'][label] = run_load(
+                    base_url,
+                    endpoints,
+                    duration=options['duration'],
+                    concurrency=options['concurrency'],
+                )
+        self.stdout.write(json.dumps(report, indent=2))
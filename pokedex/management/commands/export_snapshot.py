@@ -0,0 +1,43 @@
+"""Module for exporting the Pokédex as a columnar Arrow IPC snapshot."""
+from django.core.management.base import BaseCommand
+
+from pokedex.models import DatasetVersion
+from pokedex.services import PokedexSnapshot
+
+
+class Command(BaseCommand):
+    """Django management command to write an Arrow IPC snapshot of the Pokédex."""
+
+    help = 'Export the Pokédex as Arrow IPC files keyed by the current dataset version.'
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the snapshot output directory.
+
+        :param parser: ArgumentParser instance to which arguments are added.
+        """
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Directory to write snapshots to (default=settings.SNAPSHOT_DIR)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild the snapshot even if one exists for the current version'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Build the snapshot for the current dataset version.
+
+        :param args: Positional arguments (unused).
+        :param options: Dictionary of command options, expects 'output' and 'force'.
+        """
+        snapshot = PokedexSnapshot(root=options.get('output'))
+        version = DatasetVersion.current()
+        if options.get('force'):
+            directory = snapshot.build(version)
+        else:
+            directory = snapshot.ensure(version)
+        self.stdout.write(self.style.SUCCESS(f'Pokédex snapshot written to {directory}'))
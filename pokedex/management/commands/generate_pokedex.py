@@ -0,0 +1,180 @@
+"""Module for filling the database with a large synthetic Pokédex for scale testing."""
+import argparse
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from pokedex.benchmarks import seed_pokedex
+from pokedex.models import (
+    Ability,
+    DatasetVersion,
+    EvolutionChain,
+    Move,
+    Pokemon,
+    PokemonMove,
+    PokemonPayload,
+    PokemonStat,
+    Stat,
+    Type,
+)
+from pokedex.services.payloads import store_payloads
+
+
+class Command(BaseCommand):
+    """Django management command bulk-generating synthetic Pokémon and related rows."""
+
+    help = (
+        'Generate a deterministic synthetic Pokédex (Pokémon, types, abilities, moves, stats '
+        'and evolution chains) of the given size with bulk inserts, for profiling at scale.'
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the size and distribution of the generated data.
+
+        :param parser: ArgumentParser instance to which arguments are added.
+        """
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=100_000,
+            help='Number of Pokémon to generate (default=100000)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed (default=0)'
+        )
+        parser.add_argument(
+            '--abilities',
+            type=int,
+            help='Number of distinct abilities (default=size/4, at least 10)'
+        )
+        parser.add_argument(
+            '--max-abilities',
+            type=int,
+            default=3,
+            help='Each Pokémon gets between 1 and this many abilities (default=3)'
+        )
+        parser.add_argument(
+            '--dual-type-ratio',
+            type=float,
+            default=0.5,
+            help='Share of Pokémon with two types (default=0.5)'
+        )
+        parser.add_argument(
+            '--type-skew',
+            type=float,
+            default=0.0,
+            help='Zipf exponent of type popularity; 0 is uniform, 1 is heavily skewed (default=0)'
+        )
+        parser.add_argument(
+            '--ability-skew',
+            type=float,
+            default=0.0,
+            help='Zipf exponent of ability popularity (default=0)'
+        )
+        parser.add_argument(
+            '--moves',
+            type=int,
+            default=10,
+            help='Moves learned per Pokémon (default=10)'
+        )
+        parser.add_argument(
+            '--move-pool',
+            type=int,
+            default=900,
+            help='Number of distinct moves (default=900)'
+        )
+        parser.add_argument(
+            '--move-skew',
+            type=float,
+            default=0.0,
+            help='Zipf exponent of move popularity (default=0)'
+        )
+        parser.add_argument(
+            '--chain-length',
+            type=int,
+            default=3,
+            help='Pokémon per evolution chain (default=3)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Pokémon generated and inserted per chunk (default=5000)'
+        )
+        parser.add_argument(
+            '--payloads',
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help='Pre-encode detail and compare payloads like an import does (default=on)'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete existing Pokédex data first instead of refusing to run'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Generate the synthetic Pokédex.
+
+        :param args: Positional arguments (unused).
+        :param options: Dictionary of command options.
+        :raises CommandError: If the database already holds Pokédex data and --clear is not set.
+        """
+        if options['size'] < 1 or options['chain_length'] < 1 or options['max_abilities'] < 1:
+            raise CommandError('--size, --chain-length and --max-abilities must be positive.')
+        if Pokemon.objects.exists() or Type.objects.exists():
+            if not options['clear']:
+                raise CommandError('The database already contains Pokédex data; pass --clear.')
+            self._clear()
+
+        started = time.perf_counter()
+        seed_pokedex(
+            options['size'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            abilities=options['abilities'],
+            chain_length=options['chain_length'],
+            dual_type_ratio=options['dual_type_ratio'],
+            max_abilities=options['max_abilities'],
+            type_skew=options['type_skew'],
+            ability_skew=options['ability_skew'],
+            moves=options['moves'],
+            move_pool=options['move_pool'],
+            move_skew=options['move_skew'],
+        )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {options['size']} Pokémon in {elapsed:.1f}s."
+        ))
+
+        if options['payloads']:
+            started = time.perf_counter()
+            with transaction.atomic():
+                store_payloads(DatasetVersion.current())
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(f"Stored payloads in {elapsed:.1f}s."))
+
+    @staticmethod
+    def _clear():
+        """Delete all Pokédex rows, without loading them, in one transaction."""
+        with transaction.atomic():
+            for model in (
+                PokemonPayload,
+                PokemonMove,
+                PokemonStat,
+                Pokemon.types.through,
+                Pokemon.abilities.through,
+                Pokemon,
+                EvolutionChain,
+                Type,
+                Ability,
+                Stat,
+                Move,
+            ):
+                model.objects.all()._raw_delete(model.objects.db)
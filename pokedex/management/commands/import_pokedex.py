@@ -1,10 +1,11 @@
 """Module for importing Pokémon data from the PokéAPI into the database."""
+import argparse
 import logging
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
-from pokedex.services import PokeAPIClient, PokedexImporter
+from pokedex.services import PokeAPIClient, PokedexImporter, SpriteCache
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,12 @@ class Command(BaseCommand):
             default=100,
             help='Max number of Pokémon to import (default=all available)'
         )
+        parser.add_argument(
+            '--sprites',
+            action=argparse.BooleanOptionalAction,
+            default=settings.SPRITE_CACHE,
+            help='Download sprites and generate thumbnails locally (default=SPRITE_CACHE)'
+        )
 
     def handle(self, *args, **options):
         """
@@ -35,11 +42,12 @@ class Command(BaseCommand):
         and runs the import_range with the given limit.
 
         :param args: Positional arguments (unused).
-        :param options: Dictionary of command options, expects 'limit'.
+        :param options: Dictionary of command options, expects 'limit' and 'sprites'.
         """
         base = settings.API_BASE
         client = PokeAPIClient(base_url=base)
-        importer = PokedexImporter(client=client)
+        sprite_cache = SpriteCache() if options.get('sprites') else None
+        importer = PokedexImporter(client=client, sprite_cache=sprite_cache)
 
         log_level = logging.INFO
         logging.basicConfig(level=log_level)
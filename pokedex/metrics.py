@@ -0,0 +1,95 @@
+"""
+Prometheus metrics for the Pokedex API and importer.
+
+When the ``PROMETHEUS_MULTIPROC_DIR`` environment variable points to a writable
+directory, prometheus_client stores samples in memory-mapped files there, so the
+``/metrics`` endpoint aggregates every gunicorn worker as well as separate
+``import_pokedex`` processes. Without it metrics are kept per process.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_LATENCY = Histogram(
+    'pokedex_request_duration_seconds',
+    'Time spent handling a request, by URL name.',
+    ['view', 'method', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERIES = Counter(
+    'pokedex_db_queries_total',
+    'SQL queries run while handling requests, by URL name.',
+    ['view'],
+)
+DB_QUERY_SECONDS = Counter(
+    'pokedex_db_query_seconds_total',
+    'Time spent in SQL queries while handling requests, by URL name.',
+    ['view'],
+)
+CACHE_REQUESTS = Counter(
+    'pokedex_cache_requests_total',
+    'Lookups in derived-data caches, by cache and result (hit/miss).',
+    ['cache', 'result'],
+)
+
+POKEAPI_REQUESTS = Counter(
+    'pokedex_pokeapi_requests_total',
+    'HTTP requests made to the PokéAPI.',
+)
+POKEAPI_RETRIES = Counter(
+    'pokedex_pokeapi_retries_total',
+    'HTTP retries made to the PokéAPI.',
+)
+POKEAPI_FAILURES = Counter(
+    'pokedex_pokeapi_failures_total',
+    'PokéAPI requests that failed after retries.',
+)
+POKEAPI_BYTES = Counter(
+    'pokedex_pokeapi_downloaded_bytes_total',
+    'Response bytes downloaded from the PokéAPI.',
+)
+
+IMPORTED_POKEMON = Counter(
+    'pokedex_import_pokemon_total',
+    'Pokémon fetched by the importer, by result (imported/failed).',
+    ['result'],
+)
+IMPORT_DURATION = Gauge(
+    'pokedex_import_last_duration_seconds',
+    'Wall time of the last successful import.',
+    multiprocess_mode='mostrecent',
+)
+IMPORT_THROUGHPUT = Gauge(
+    'pokedex_import_last_pokemon_per_second',
+    'Pokémon imported per second during the last successful import.',
+    multiprocess_mode='mostrecent',
+)
+IMPORT_LAST_SUCCESS = Gauge(
+    'pokedex_import_last_success_timestamp_seconds',
+    'Unix time at which the last successful import finished.',
+    multiprocess_mode='mostrecent',
+)
+
+
+def record_cache(cache, hit):
+    """Count a hit or miss in one of the derived-data caches."""
+    CACHE_REQUESTS.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+
+def render_latest():
+    """Return the current metrics in Prometheus text format and its content type."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
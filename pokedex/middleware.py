@@ -0,0 +1,353 @@
+"""Middleware used by the Pokedex project."""
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware as BaseWhiteNoiseMiddleware
+
+from pokedex import metrics
+from pokedex.models import DatasetVersion
+from pokedex.services.compression import CompressedResponseCache, negotiate_encoding
+
+performance_logger = logging.getLogger('pokedex.performance')
+
+
+class WhiteNoiseMiddleware(BaseWhiteNoiseMiddleware):
+    """
+    WhiteNoise middleware that can also run natively under ASGI.
+
+    The stock middleware is sync-only, which forces Django to run every async
+    request through a single thread-sensitive executor. Static-file lookup is an
+    in-memory dict lookup, so it is safe to do inline in the async path too.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        """Initialize WhiteNoise and mark the instance as a coroutine under ASGI."""
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Serve a static file, or pass the request on to the next handler."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        """Async version of `__call__`."""
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a view runs more SQL queries than its budget allows."""
+
+
+class _QueryTimer:
+    """Database execute wrapper counting queries and their cumulative duration."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+def _add_execute_wrapper(wrapper):
+    connection.execute_wrappers.append(wrapper)
+
+
+def _remove_execute_wrapper(wrapper):
+    connection.execute_wrappers.remove(wrapper)
+
+
+class _RequestTimings:
+    """Timestamps and query stats collected while one request is handled."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = _QueryTimer()
+        self.unbudgeted_queries = 0
+        self.view_started = None
+        self.render_started = None
+        self.render_finished = None
+
+    def as_dict(self, finished):
+        view_ended = self.render_started or finished
+        serialize = None
+        if self.render_started and self.render_finished:
+            serialize = round((self.render_finished - self.render_started) * 1000, 3)
+        return {
+            'queries': self.queries.count,
+            'db_ms': round(self.queries.duration * 1000, 3),
+            'view_ms': round((view_ended - (self.view_started or self.started)) * 1000, 3),
+            'serialize_ms': serialize,
+            'total_ms': round((finished - self.started) * 1000, 3),
+        }
+
+
+@contextmanager
+def timed_serialization(request):
+    """
+    Record the enclosed block as the request's serialization phase.
+
+    DRF responses are timed while they render; views that encode their JSON
+    themselves (such as the async views) wrap the encoding in this instead.
+    Does nothing for requests not seen by `PerformanceMiddleware`.
+    """
+    timings = getattr(request, '_timings', None)
+    if timings is not None:
+        timings.render_started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings.render_finished = time.perf_counter()
+
+
+@contextmanager
+def unbudgeted_queries(request):
+    """
+    Exclude the queries run in the enclosed block from the request's query budget.
+
+    They are still reported in Server-Timing, logs and metrics. Meant for
+    middleware lookups that are not part of what the view itself costs.
+    """
+    timings = getattr(request, '_timings', None)
+    before = timings.queries.count if timings is not None else 0
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings.unbudgeted_queries += timings.queries.count - before
+
+
+class PerformanceMiddleware:
+    """
+    Record per-request SQL, view, serialization and total time.
+
+    For every request resolved to a URL the timings are emitted as a
+    `Server-Timing` header, a JSON log line on the `pokedex.performance`
+    logger and Prometheus metrics. Serialization is only reported for responses
+    that were serialized during the request (DRF rendering or
+    `timed_serialization`), not for pre-encoded bodies. Views listed in
+    `settings.QUERY_BUDGETS` (by URL name) that run more queries than allowed
+    log a warning, or raise `QueryBudgetExceeded` when
+    `settings.QUERY_BUDGET_STRICT` is on (as in the test suite's budget checks).
+    Queries run under `unbudgeted_queries` are reported but not budgeted.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Store the next handler and mark the instance as a coroutine under ASGI."""
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Time the request and annotate the response."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request._timings = timings = _RequestTimings()
+        with connection.execute_wrapper(timings.queries):
+            response = self.get_response(request)
+        return self._finish(request, response, timings)
+
+    async def __acall__(self, request):
+        """
+        Async version of `__call__`.
+
+        Database connections are per thread and the async ORM runs queries in
+        the request's thread-sensitive executor, so the query timer has to be
+        installed on that thread's connection.
+        """
+        request._timings = timings = _RequestTimings()
+        await sync_to_async(_add_execute_wrapper)(timings.queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(_remove_execute_wrapper)(timings.queries)
+        return self._finish(request, response, timings)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Mark the start of the view."""
+        request._timings.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        """Mark the end of the view and time the rendering (DRF serialization) that follows."""
+        timings = request._timings
+        timings.render_started = time.perf_counter()
+
+        def render_finished(rendered):
+            timings.render_finished = time.perf_counter()
+
+        response.add_post_render_callback(render_finished)
+        return response
+
+    def _finish(self, request, response, timings):
+        match = request.resolver_match
+        if match is None:
+            return response
+
+        stats = timings.as_dict(time.perf_counter())
+        server_timing = [
+            f'db;dur={stats["db_ms"]};desc="{stats["queries"]} queries"',
+            f'view;dur={stats["view_ms"]}',
+        ]
+        if stats['serialize_ms'] is not None:
+            server_timing.append(f'serialize;dur={stats["serialize_ms"]}')
+        server_timing.append(f'total;dur={stats["total_ms"]}')
+        response['Server-Timing'] = ', '.join(server_timing)
+        performance_logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name,
+            'status': response.status_code,
+            **stats,
+        }))
+
+        metrics.REQUEST_LATENCY.labels(
+            view=match.view_name, method=request.method, status=response.status_code
+        ).observe(stats['total_ms'] / 1000)
+        metrics.DB_QUERIES.labels(view=match.view_name).inc(stats['queries'])
+        metrics.DB_QUERY_SECONDS.labels(view=match.view_name).inc(stats['db_ms'] / 1000)
+
+        budget = settings.QUERY_BUDGETS.get(match.view_name)
+        budgeted = stats['queries'] - timings.unbudgeted_queries
+        if budget is not None and budgeted > budget:
+            message = (
+                f"{match.view_name} ran {budgeted} SQL queries "
+                f"(budget {budget}) for {request.get_full_path()}"
+            )
+            if settings.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceeded(message)
+            performance_logger.warning(message)
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Serve version-stable API responses from cached brotli/gzip variants.
+
+    Only GET requests to views listed in `settings.COMPRESSED_VIEWS` (by URL
+    name) are handled. The encoding is negotiated from Accept-Encoding; a cached
+    variant for the current dataset version is returned without running the
+    view, otherwise the view's response is compressed once and cached. Requests
+    that accept no supported encoding pass through untouched, and every response
+    of these views varies on Accept-Encoding.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Store the next handler and mark the instance as a coroutine under ASGI."""
+        self.get_response = get_response
+        self.variants = CompressedResponseCache()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Serve or build the compressed variant of a response."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._compressible(request):
+            return self.get_response(request)
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''))
+        if encoding is None:
+            return self._vary(self.get_response(request))
+
+        with unbudgeted_queries(request):
+            version = DatasetVersion.for_request(request)
+        variant = self.variants.get(request, version, encoding)
+        metrics.record_cache('compressed', variant is not None)
+        if variant is not None:
+            return self._serve(request, variant, encoding)
+
+        response = self.get_response(request)
+        variant = self.variants.variant(response, encoding)
+        if variant is None:
+            return self._vary(response)
+        self.variants.set(request, version, encoding, variant)
+        return self._serve(request, variant, encoding)
+
+    async def __acall__(self, request):
+        """Async version of `__call__`."""
+        if not self._compressible(request):
+            return await self.get_response(request)
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''))
+        if encoding is None:
+            return self._vary(await self.get_response(request))
+
+        with unbudgeted_queries(request):
+            version = await sync_to_async(DatasetVersion.for_request)(request)
+        variant = await self.variants.aget(request, version, encoding)
+        metrics.record_cache('compressed', variant is not None)
+        if variant is not None:
+            return self._serve(request, variant, encoding)
+
+        response = await self.get_response(request)
+        variant = self.variants.variant(response, encoding)
+        if variant is None:
+            return self._vary(response)
+        await self.variants.aset(request, version, encoding, variant)
+        return self._serve(request, variant, encoding)
+
+    @staticmethod
+    def _compressible(request):
+        """
+        Return whether the request targets a view whose responses are cached compressed.
+
+        The resolver match is kept on the request so that cache hits, which skip
+        URL resolution in the handler, are still timed per view.
+        """
+        if request.method != 'GET':
+            return False
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return False
+        if match.url_name not in settings.COMPRESSED_VIEWS:
+            return False
+        request.resolver_match = match
+        return True
+
+    @staticmethod
+    def _vary(response):
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
+
+    @staticmethod
+    def _serve(request, variant, encoding):
+        body, headers = variant
+        response = HttpResponse(body)
+        for name, value in headers.items():
+            response[name] = value
+        response['Content-Encoding'] = encoding
+        response['Content-Length'] = str(len(body))
+        patch_vary_headers(response, ['Accept-Encoding'])
+        # Revalidation of views that send an ETag (e.g. bootstrap) still gets a 304.
+        return get_conditional_response(request, etag=response.get('ETag'), response=response)
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:52
+
+from django.db import migrations, models
+
+# The M2M tables are auto-created, so their composite indexes cannot be declared
+# on a model. (type_id, pokemon_id) covers the list view's type/ability filter
+# joins without touching the table rows. It also makes Django's automatic
+# single-column type_id/ability_id index redundant, so that one is dropped to
+# spare M2M writes the extra index maintenance.
+M2M_INDEXES = [
+    ('pokedex_pokemon_types_type_pokemon_idx', 'pokedex_pokemon_types', 'type_id'),
+    ('pokedex_pokemon_abilities_ability_pokemon_idx', 'pokedex_pokemon_abilities', 'ability_id'),
+]
+
+
+def _single_column_indexes(schema_editor, table, column):
+    with schema_editor.connection.cursor() as cursor:
+        constraints = schema_editor.connection.introspection.get_constraints(cursor, table)
+    return [
+        name for name, info in constraints.items()
+        if info['index'] and not info['unique'] and not info['primary_key']
+        and info['columns'] == [column]
+    ]
+
+
+def drop_single_column_indexes(apps, schema_editor):
+    """Drop the automatic FK indexes now covered by the composite indexes."""
+    for _name, table, column in M2M_INDEXES:
+        for index in _single_column_indexes(schema_editor, table, column):
+            schema_editor.execute(f'DROP INDEX {schema_editor.quote_name(index)}')
+
+
+def restore_single_column_indexes(apps, schema_editor):
+    """Recreate the single-column FK indexes."""
+    for _name, table, column in M2M_INDEXES:
+        if not _single_column_indexes(schema_editor, table, column):
+            schema_editor.execute(
+                f'CREATE INDEX {schema_editor.quote_name(f"{table}_{column}_idx")} '
+                f'ON {schema_editor.quote_name(table)} ({schema_editor.quote_name(column)})'
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0003_datasetversion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pokemonstat',
+            index=models.Index(fields=['stat', 'base_stat'], name='pokemonstat_stat_base_idx'),
+        ),
+        *[
+            migrations.RunSQL(
+                sql=f'CREATE INDEX "{name}" ON "{table}" ("{column}", "pokemon_id");',
+                reverse_sql=f'DROP INDEX "{name}";',
+            )
+            for name, table, column in M2M_INDEXES
+        ],
+        migrations.RunPython(drop_single_column_indexes, restore_single_column_indexes),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0005_importrun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pokemon',
+            name='sprite_hash',
+            field=models.CharField(blank=True, default='', max_length=12),
+        ),
+    ]
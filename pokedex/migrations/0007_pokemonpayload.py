@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0006_pokemon_sprite_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PokemonPayload',
+            fields=[
+                ('pokemon', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='payload', serialize=False, to='pokedex.pokemon')),
+                ('dataset_version', models.PositiveIntegerField()),
+                ('detail', models.BinaryField()),
+                ('compare', models.BinaryField()),
+            ],
+        ),
+    ]
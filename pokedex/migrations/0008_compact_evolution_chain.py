@@ -0,0 +1,87 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:20
+
+import json
+import zlib
+
+from django.db import migrations, models
+
+
+def _stages(node, parent=None):
+    species = node['species']
+    species_ref = species.get('url', '').rstrip('/').rsplit('/', 1)[-1]
+    species_id = int(species_ref) if species_ref.isdigit() else None
+    details = (node.get('evolution_details') or [{}])[0]
+    stage = {
+        'species_id': species_id,
+        'name': species['name'],
+        'parent_id': parent['species_id'] if parent else None,
+        'parent': parent['name'] if parent else None,
+        'trigger': (details.get('trigger') or {}).get('name'),
+        'min_level': details.get('min_level'),
+        'item': (details.get('item') or {}).get('name'),
+    }
+    stages = [stage]
+    for evo in node.get('evolves_to', []):
+        stages += _stages(evo, parent=stage)
+    return stages
+
+
+def compact_chains(apps, schema_editor):
+    """Convert raw PokéAPI chains to stages, keeping the original compressed in `raw`."""
+    EvolutionChain = apps.get_model('pokedex', 'EvolutionChain')
+    for chain in EvolutionChain.objects.all():
+        data = chain.data or {}
+        chain.stages = _stages(data['chain']) if data.get('chain') else []
+        chain.raw = zlib.compress(json.dumps(data, separators=(',', ':')).encode())
+        chain.save(update_fields=['stages', 'raw'])
+
+
+def expand_chains(apps, schema_editor):
+    """Restore `data` from `raw`, or rebuild a minimal nested chain from the stages."""
+    EvolutionChain = apps.get_model('pokedex', 'EvolutionChain')
+    for chain in EvolutionChain.objects.all():
+        if chain.raw:
+            chain.data = json.loads(zlib.decompress(chain.raw))
+        else:
+            nodes = {}
+            root = None
+            for stage in chain.stages:
+                node = {'species': {'name': stage['name']}, 'evolves_to': []}
+                nodes[stage['name']] = node
+                parent = nodes.get(stage['parent']) if stage['parent'] else None
+                if parent is not None:
+                    parent['evolves_to'].append(node)
+                elif root is None:
+                    root = node
+            chain.data = {'chain': root} if root else {}
+        chain.save(update_fields=['data'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0007_pokemonpayload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='evolutionchain',
+            name='stages',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='evolutionchain',
+            name='raw',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='evolutionchain',
+            name='data',
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(compact_chains, expand_chains),
+        migrations.RemoveField(
+            model_name='evolutionchain',
+            name='data',
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0008_compact_evolution_chain'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Move',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PokemonMove',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('learn_method', models.CharField(max_length=50)),
+                ('level', models.PositiveSmallIntegerField(default=0)),
+                ('move', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='pokedex.move')),
+                ('pokemon', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='pokedex.pokemon')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='pokemon',
+            name='moves',
+            field=models.ManyToManyField(related_name='pokemon', through='pokedex.PokemonMove', to='pokedex.move'),
+        ),
+        migrations.AddIndex(
+            model_name='pokemonmove',
+            index=models.Index(fields=['move', 'pokemon'], name='pokemonmove_move_pokemon_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='pokemonmove',
+            constraint=models.UniqueConstraint(fields=('pokemon', 'move', 'learn_method'), name='pokemonmove_unique'),
+        ),
+    ]
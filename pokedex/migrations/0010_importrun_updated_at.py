@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0009_moves'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importrun',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
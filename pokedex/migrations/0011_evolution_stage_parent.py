@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:20
+
+import json
+import zlib
+
+from django.db import migrations
+
+
+def _stages(node, parent=None):
+    species = node['species']
+    species_ref = species.get('url', '').rstrip('/').rsplit('/', 1)[-1]
+    species_id = int(species_ref) if species_ref.isdigit() else None
+    details = (node.get('evolution_details') or [{}])[0]
+    stage = {
+        'species_id': species_id,
+        'name': species['name'],
+        'parent_id': parent['species_id'] if parent else None,
+        'parent': parent['name'] if parent else None,
+        'trigger': (details.get('trigger') or {}).get('name'),
+        'min_level': details.get('min_level'),
+        'item': (details.get('item') or {}).get('name'),
+    }
+    stages = [stage]
+    for evo in node.get('evolves_to', []):
+        stages += _stages(evo, parent=stage)
+    return stages
+
+
+def add_parent_names(apps, schema_editor):
+    """
+    Give every stage the name of its parent species.
+
+    Stages compacted before parents were stored by name lost the link below
+    species without an ID; those are rebuilt from `raw` when it was kept.
+    """
+    EvolutionChain = apps.get_model('pokedex', 'EvolutionChain')
+    for chain in EvolutionChain.objects.all():
+        if all('parent' in stage for stage in chain.stages):
+            continue
+        raw = json.loads(zlib.decompress(chain.raw)) if chain.raw else {}
+        if raw.get('chain'):
+            chain.stages = _stages(raw['chain'])
+        else:
+            names = {s['species_id']: s['name'] for s in chain.stages if s['species_id']}
+            for stage in chain.stages:
+                stage['parent'] = names.get(stage['parent_id'])
+        chain.save(update_fields=['stages'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokedex', '0010_importrun_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_parent_names, migrations.RunPython.noop),
+    ]
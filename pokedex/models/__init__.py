@@ -1,2 +1,13 @@
 """Import models."""
-from .pokedex import Ability, EvolutionChain, Pokemon, PokemonStat, Stat, Type
+from .dataset import DatasetVersion, ImportRun
+from .payload import PokemonPayload
+from .pokedex import (
+    Ability,
+    EvolutionChain,
+    Move,
+    Pokemon,
+    PokemonMove,
+    PokemonStat,
+    Stat,
+    Type,
+)
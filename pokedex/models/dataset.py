@@ -0,0 +1,89 @@
+"""Module defining dataset bookkeeping models: the version marker and import runs."""
+
+from django.db import models
+from django.db.models import F
+
+
+class DatasetVersion(models.Model):
+    """
+    Singleton row tracking the version of the imported Pokédex data.
+
+    The version is bumped every time an import finishes, so anything
+    derived from the dataset (snapshots, cached payloads) can be keyed by it.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """Return a readable identifier for the dataset version."""
+        return f"DatasetVersion {self.version}"
+
+    @classmethod
+    def current(cls):
+        """Return the current dataset version number (0 if nothing was imported yet)."""
+        row = cls.objects.filter(id=cls.SINGLETON_ID).values_list('version', flat=True).first()
+        return row or 0
+
+    @classmethod
+    def for_request(cls, request):
+        """
+        Return the current dataset version, looked up at most once per request.
+
+        Middleware and views handling the same request share the value through
+        `request.dataset_version`.
+        """
+        version = getattr(request, 'dataset_version', None)
+        if version is None:
+            version = request.dataset_version = cls.current()
+        return version
+
+    @classmethod
+    def bump(cls):
+        """Increment the dataset version and return the new value."""
+        obj, created = cls.objects.get_or_create(id=cls.SINGLETON_ID, defaults={'version': 1})
+        if not created:
+            cls.objects.filter(id=cls.SINGLETON_ID).update(version=F('version') + 1)
+            obj.refresh_from_db(fields=['version'])
+        return obj.version
+
+
+class ImportRun(models.Model):
+    """Progress and outcome of one run of the Pokédex importer."""
+
+    class Status(models.TextChoices):
+        """Lifecycle states of an import run."""
+
+        RUNNING = 'running', 'Running'
+        PUBLISHING = 'publishing', 'Publishing'
+        SUCCEEDED = 'succeeded', 'Succeeded'
+        FAILED = 'failed', 'Failed'
+
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.RUNNING)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    dataset_version = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """Meta options for ImportRun model: newest runs first."""
+
+        ordering = ['-started_at', '-id']
+
+    def __str__(self):
+        """Return a readable identifier for the import run."""
+        return f"ImportRun {self.pk} ({self.status})"
+
+    @property
+    def progress(self):
+        """Return the fraction of Pokémon fetched so far, between 0 and 1."""
+        if not self.total:
+            return 0.0
+        return round(min(1.0, (self.processed + self.failed) / self.total), 4)
@@ -0,0 +1,25 @@
+"""Module defining the table of pre-encoded Pokémon API payloads."""
+
+from django.db import models
+
+from .pokedex import Pokemon
+
+
+class PokemonPayload(models.Model):
+    """
+    Pre-encoded JSON bodies of the detail and compare endpoints for one Pokémon.
+
+    Rows are rebuilt whenever an import publishes a new dataset version and are
+    only served while `dataset_version` matches the current `DatasetVersion`.
+    """
+
+    pokemon = models.OneToOneField(
+        Pokemon, primary_key=True, on_delete=models.CASCADE, related_name='payload'
+    )
+    dataset_version = models.PositiveIntegerField()
+    detail = models.BinaryField()
+    compare = models.BinaryField()
+
+    def __str__(self):
+        """Return a readable identifier for the payload."""
+        return f"PokemonPayload {self.pokemon_id} (v{self.dataset_version})"
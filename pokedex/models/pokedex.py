@@ -1,4 +1,6 @@
 """Module defining Pokémon-related models for the Pokedex application."""
+import json
+import zlib
 
 from django.db import models
 
@@ -48,16 +50,92 @@ class Stat(models.Model):
         return self.name
 
 
+class Move(models.Model):
+    """Represent a move Pokémon can learn (e.g., Earthquake, Thunderbolt)."""
+
+    name = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        """Meta options for Move model: default ordering by name."""
+
+        ordering = ['name']
+
+    def __str__(self):
+        """Return the name of the move."""
+        return self.name
+
+
 class EvolutionChain(models.Model):
-    """Store the full evolution chain data for a Pokémon species."""
+    """
+    Store the evolution chain of a Pokémon species in compact form.
+
+    `stages` lists the chain's species in evolution order (depth first, as
+    PokéAPI nests them), each with its species ID and name, the ID and name of
+    the species it evolves from and the trigger, minimum level and item of the
+    evolution leading to it. Parents are resolved by name, since species IDs are
+    parsed from URLs and may be missing. The full PokéAPI payload is only kept,
+    zlib-compressed, in `raw` when `EVOLUTION_CHAIN_RAW` is enabled.
+    """
 
     chain_id = models.PositiveIntegerField(primary_key=True)
-    data = models.JSONField()
+    stages = models.JSONField(default=list)
+    raw = models.BinaryField(null=True, blank=True)
 
     def __str__(self):
         """Return a readable identifier for the evolution chain."""
         return f"EvolutionChain {self.chain_id}"
 
+    @staticmethod
+    def stage(
+        species_id, name, parent_id=None, parent=None, trigger=None, min_level=None, item=None
+    ):
+        """Return one entry of `stages`; `parent` is the name of the preceding species."""
+        return {
+            'species_id': species_id,
+            'name': name,
+            'parent_id': parent_id,
+            'parent': parent,
+            'trigger': trigger,
+            'min_level': min_level,
+            'item': item,
+        }
+
+    @classmethod
+    def stages_from_api(cls, chain_node, parent=None):
+        """
+        Flatten a PokéAPI `chain` node and its descendants into `stages` entries.
+
+        :param chain_node: The `chain` object of an `/evolution-chain` payload.
+        :param parent: Stage dict of the species this node evolves from.
+        :return: List of stage dicts in evolution order.
+        """
+        species = chain_node['species']
+        species_ref = species.get('url', '').rstrip('/').rsplit('/', 1)[-1]
+        species_id = int(species_ref) if species_ref.isdigit() else None
+        details = (chain_node.get('evolution_details') or [{}])[0]
+        stage = cls.stage(
+            species_id,
+            species['name'],
+            parent_id=parent['species_id'] if parent else None,
+            parent=parent['name'] if parent else None,
+            trigger=(details.get('trigger') or {}).get('name'),
+            min_level=details.get('min_level'),
+            item=(details.get('item') or {}).get('name'),
+        )
+        stages = [stage]
+        for evo in chain_node.get('evolves_to', []):
+            stages += cls.stages_from_api(evo, parent=stage)
+        return stages
+
+    @staticmethod
+    def compress_raw(data):
+        """Return a PokéAPI payload as zlib-compressed JSON for `raw`."""
+        return zlib.compress(json.dumps(data, separators=(',', ':')).encode())
+
+    def raw_data(self):
+        """Return the decompressed PokéAPI payload, or None if it was not kept."""
+        return json.loads(zlib.decompress(self.raw)) if self.raw else None
+
 
 class Pokemon(models.Model):
     """Represent a Pokémon entry with all its core attributes."""
@@ -68,9 +146,11 @@ class Pokemon(models.Model):
     weight = models.IntegerField()
     base_experience = models.IntegerField()
     sprite_url = models.URLField(blank=True, default="")
+    sprite_hash = models.CharField(max_length=12, blank=True, default="")
     types = models.ManyToManyField(Type, related_name='pokemon')
     abilities = models.ManyToManyField(Ability, related_name='pokemon')
     stats = models.ManyToManyField(Stat, through='PokemonStat')
+    moves = models.ManyToManyField(Move, through='PokemonMove', related_name='pokemon')
     evolution_chain = models.ForeignKey(
         EvolutionChain,
         null=True,
@@ -89,8 +169,8 @@ class Pokemon(models.Model):
         return self.name.title()
 
     def get_evolution_chain(self):
-        """Return the raw evolution chain JSON data, or an empty dict."""
-        return self.evolution_chain.data if self.evolution_chain else {}
+        """Return the stages of the evolution chain, or an empty list."""
+        return self.evolution_chain.stages if self.evolution_chain else []
 
 
 class PokemonStat(models.Model):
@@ -101,10 +181,50 @@ class PokemonStat(models.Model):
     base_stat = models.IntegerField()
 
     class Meta:
-        """Meta options for PokemonStat: enforce unique (pokemon, stat) pairs."""
+        """
+        Meta options for PokemonStat.
+
+        Enforce unique (pokemon, stat) pairs and index (stat, base_stat) so
+        "top N by stat" queries can walk the index instead of sorting.
+        """
 
         unique_together = (('pokemon', 'stat'),)
+        indexes = [
+            models.Index(fields=['stat', 'base_stat'], name='pokemonstat_stat_base_idx'),
+        ]
 
     def __str__(self):
         """Return a string like "pikachu: speed=90"."""
         return f"{self.pokemon.name}: {self.stat.name}={self.base_stat}"
+
+
+class PokemonMove(models.Model):
+    """Through model linking Pokémon to the moves they learn, with the method and level."""
+
+    pokemon = models.ForeignKey(Pokemon, on_delete=models.CASCADE, db_index=False)
+    move = models.ForeignKey(Move, on_delete=models.CASCADE, db_index=False)
+    learn_method = models.CharField(max_length=50)
+    level = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        """
+        Meta options for PokemonMove.
+
+        The table holds ~100 rows per Pokémon, so the single-column foreign key
+        indexes are dropped: the unique (pokemon, move, learn_method) constraint
+        serves per-Pokémon lookups and the (move, pokemon) index serves the list
+        endpoint's `move` filter as a covering index.
+        """
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=['pokemon', 'move', 'learn_method'], name='pokemonmove_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['move', 'pokemon'], name='pokemonmove_move_pokemon_idx'),
+        ]
+
+    def __str__(self):
+        """Return a string like "pikachu: thunderbolt (machine)"."""
+        return f"{self.pokemon.name}: {self.move.name} ({self.learn_method})"
@@ -0,0 +1,31 @@
+"""Module with a fast JSON renderer for the REST API."""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render DRF responses as compact UTF-8 JSON using orjson."""
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Serialize response data to JSON bytes.
+
+        Types orjson does not know (lazy translations, decimals, querysets...)
+        fall back to DRF's own JSON encoder. Datetimes are passed to it as well, so
+        they keep DRF's format (millisecond precision, ``Z`` for UTC).
+
+        :param data: Response data.
+        :param accepted_media_type: Negotiated media type (unused).
+        :param renderer_context: Renderer context (unused).
+        :return: Encoded JSON, or empty bytes for no data.
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data, default=JSONEncoder().default, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
@@ -1,3 +1,5 @@
 """Import services."""
 from .importer import PokedexImporter
 from .pokeapi import PokeAPIClient
+from .snapshot import PokedexSnapshot
+from .sprites import SpriteCache
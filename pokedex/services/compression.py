@@ -0,0 +1,119 @@
+"""Module caching compressed API response bodies, keyed by dataset version and encoding."""
+import gzip
+import hashlib
+
+import brotli
+from django.conf import settings
+from django.core.cache import caches
+
+# Variants are compressed once per dataset version, so the slowest, densest levels pay off.
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+# Content codings this server produces, most preferred first: brotli is denser than gzip.
+ENCODINGS = ('br', 'gzip')
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    Pick the content coding to use for a request.
+
+    :param accept_encoding: Value of the request's Accept-Encoding header.
+    :return: 'br' or 'gzip', or None when the response should be sent uncompressed.
+    """
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = None, 0.0
+    for coding in ENCODINGS:
+        weight = weights.get(coding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body, encoding):
+    """Return the body compressed with the given content coding."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressedResponseCache:
+    """
+    Compressed variants of version-stable API responses.
+
+    Entries live in the `settings.COMPRESSED_RESPONSE_CACHE` Django cache and are
+    keyed by dataset version, encoding, path with query string and Accept header.
+    A new import bumps the dataset version, so stale variants are never served and
+    are left for the cache to evict.
+    """
+
+    def __init__(self, alias=None):
+        """
+        Initialize the cache.
+
+        :param alias: Django cache alias (defaults to settings.COMPRESSED_RESPONSE_CACHE).
+        """
+        self.cache = caches[alias or settings.COMPRESSED_RESPONSE_CACHE]
+
+    @staticmethod
+    def key(request, version, encoding):
+        """Return the cache key of a request's variant for a dataset version and encoding."""
+        digest = hashlib.sha1(
+            f"{request.get_full_path()}\n{request.headers.get('Accept', '')}".encode()
+        ).hexdigest()
+        return f"compressed:{version}:{encoding}:{digest}"
+
+    @staticmethod
+    def variant(response, encoding):
+        """
+        Return a cacheable variant of a rendered response, or None if it should not be cached.
+
+        Only complete 200 JSON responses of at least `settings.COMPRESSION_MIN_SIZE`
+        bytes are compressed; smaller bodies barely shrink.
+
+        :return: Tuple of compressed body and the response headers to replay.
+        """
+        if (
+            response.status_code != 200
+            or response.streaming
+            or response.has_header('Content-Encoding')
+            or not response.get('Content-Type', '').startswith('application/json')
+            or len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return None
+        headers = {
+            name: value for name, value in response.items()
+            if name.lower() not in ('content-length', 'set-cookie')
+        }
+        return compress(response.content, encoding), headers
+
+    def get(self, request, version, encoding):
+        """Return the cached (body, headers) variant, or None."""
+        return self.cache.get(self.key(request, version, encoding))
+
+    def set(self, request, version, encoding, variant):
+        """Store a (body, headers) variant until the cache evicts it."""
+        self.cache.set(self.key(request, version, encoding), variant, timeout=None)
+
+    async def aget(self, request, version, encoding):
+        """Async version of `get`."""
+        return await self.cache.aget(self.key(request, version, encoding))
+
+    async def aset(self, request, version, encoding, variant):
+        """Async version of `set`."""
+        await self.cache.aset(self.key(request, version, encoding), variant, timeout=None)
@@ -1,12 +1,31 @@
 """Module for importing Pokémon data from the PokéAPI into the local database."""
 import logging
+import time
+from contextlib import contextmanager
+from datetime import timedelta
 
 import requests
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
-from pokedex.models import Ability, EvolutionChain, Pokemon, PokemonStat, Stat, Type
+from pokedex import metrics
+from pokedex.models import (
+    Ability,
+    DatasetVersion,
+    EvolutionChain,
+    ImportRun,
+    Move,
+    Pokemon,
+    PokemonMove,
+    PokemonStat,
+    Stat,
+    Type,
+)
 
+from .payloads import store_payloads
 from .pokeapi import PokeAPIClient
+from .sprites import SpriteCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +33,30 @@ logger = logging.getLogger(__name__)
 class PokedexImporter:
     """Handle importing Pokémon data into the database."""
 
-    def __init__(self, client: PokeAPIClient):
+    def __init__(self, client: PokeAPIClient, sprite_cache: SpriteCache = None):
         """
         Initialize the importer with a PokéAPI client.
 
         :param client: Instance of PokeAPIClient to fetch Pokémon data.
+        :param sprite_cache: Optional SpriteCache; when given, sprites are
+            downloaded and thumbnailed locally during the import.
         """
         self.client = client
+        self.sprite_cache = sprite_cache
         self.type_cache = {}
         self.ability_cache = {}
         self.stat_cache = {}
+        self.move_cache = {}
+        self.timings = {}
+
+    @contextmanager
+    def _timed(self, phase):
+        """Add the time spent inside the block to `timings[phase]`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - started
 
     def _get_or_create_type(self, name):
         if name not in self.type_cache:
@@ -47,73 +80,244 @@ class PokedexImporter:
         """
         Import a range of Pokémon by ID into the database.
 
-        Fetches species and evolution data, creates or updates records for
-        each Pokémon up to the given limit (or all available if limit is None).
+        Runs in two phases so readers never see a half-imported dataset:
+
+        1. Fetch: download Pokémon, species and evolution data for each ID up
+           to the given limit (or all available if limit is None), recording
+           progress on an `ImportRun`.
+        2. Publish: write everything in a single transaction and bump the
+           dataset version, so the new data becomes visible at once. With a
+           sprite cache, sprite versions no Pokémon links to any more are
+           deleted afterwards.
+
+        Runs left `running` or `publishing` by a process that was killed (for
+        example a background import at a server reload or container stop) are
+        marked as failed first, so the status endpoint does not report them
+        forever. A run counts as dead once it has not recorded progress for
+        `settings.IMPORT_RUN_STALE_AFTER` seconds.
+
+        Seconds spent fetching, parsing, caching sprites and writing to the
+        database are accumulated in `timings` for benchmarking.
 
         :param limit: Maximum number of Pokémon to import (defaults to all).
+        :return: The finished `ImportRun`.
         """
+        self.timings = {'fetch': 0.0, 'parse': 0.0, 'sprites': 0.0, 'write': 0.0}
         total = self.client.get_total_count()
         max_id = limit if limit and limit > 0 else total
         logger.info(f"Importing up to {max_id} Pokémon (total available: {total})")
 
+        started = time.monotonic()
+        self._fail_interrupted_runs()
+        run = ImportRun.objects.create(total=max_id)
+        try:
+            records, chains = self._fetch_range(run, max_id)
+
+            run.status = ImportRun.Status.PUBLISHING
+            run.save(update_fields=['status', 'updated_at'])
+            with self._timed('write'):
+                version = self._publish(records, chains)
+        except Exception as e:
+            run.status = ImportRun.Status.FAILED
+            run.error = str(e)
+            run.finished_at = timezone.now()
+            run.save(update_fields=['status', 'error', 'finished_at', 'updated_at'])
+            raise
+
+        run.status = ImportRun.Status.SUCCEEDED
+        run.dataset_version = version
+        run.finished_at = timezone.now()
+        run.save(update_fields=['status', 'dataset_version', 'finished_at', 'updated_at'])
+        if self.sprite_cache:
+            with self._timed('sprites'):
+                self._prune_sprites(run)
+
+        duration = time.monotonic() - started
+        metrics.IMPORT_DURATION.set(duration)
+        metrics.IMPORT_THROUGHPUT.set(run.processed / duration if duration else 0)
+        metrics.IMPORT_LAST_SUCCESS.set_to_current_time()
+        logger.info(f"Pokédex import complete (dataset version {version}).")
+        return run
+
+    @staticmethod
+    def _fail_interrupted_runs():
+        """Mark unfinished runs whose progress heartbeat went stale as failed."""
+        now = timezone.now()
+        interrupted = ImportRun.objects.filter(
+            status__in=[ImportRun.Status.RUNNING, ImportRun.Status.PUBLISHING],
+            updated_at__lt=now - timedelta(seconds=settings.IMPORT_RUN_STALE_AFTER),
+        ).update(
+            status=ImportRun.Status.FAILED,
+            error='Interrupted before finishing.',
+            finished_at=now,
+            updated_at=now,
+        )
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted import run(s) as failed")
+
+    def _prune_sprites(self, run):
+        """Delete sprite versions the published dataset no longer links to."""
+        referenced = dict(Pokemon.objects.exclude(sprite_hash='').values_list('id', 'sprite_hash'))
+        removed = self.sprite_cache.prune(referenced, older_than=run.started_at.timestamp())
+        if removed:
+            logger.info(f"Deleted {removed} unreferenced sprite version(s)")
+
+    def _fetch_range(self, run, max_id):
+        """Fetch and parse Pokémon 1..max_id, returning records and evolution chains by ID."""
+        records = []
+        chains = {}
+        chain_ids_by_url = {}
         for pid in range(1, max_id + 1):
             logger.info(f"Importing Pokémon #{pid}")
             try:
-                data = self.client.get_pokemon(pid)
-            except requests.HTTPError as e:
+                with self._timed('fetch'):
+                    data = self.client.get_pokemon(pid)
+                    species = self.client.get_species(data['species']['url'])
+                    evo_url = species.get('evolution_chain', {}).get('url')
+                    if evo_url and evo_url not in chain_ids_by_url:
+                        evo_data = self.client.get_evolution_chain(evo_url)
+                        chain_ids_by_url[evo_url] = evo_data['id']
+                        chains[evo_data['id']] = evo_data
+            except requests.RequestException as e:
                 logger.error(f"Failed to fetch Pokémon {pid}: {e}")
+                run.failed += 1
+                run.save(update_fields=['failed', 'updated_at'])
+                metrics.IMPORTED_POKEMON.labels(result='failed').inc()
                 continue
 
-            with transaction.atomic():
-                # Evolution chain
-                species = self.client.get_species(data['species']['url'])
-                evo_url = species.get('evolution_chain', {}).get('url')
-                chain = None
-                if evo_url:
-                    evo_data = self.client.get_evolution_chain(evo_url)
-                    chain, _ = EvolutionChain.objects.update_or_create(
-                        chain_id=evo_data['id'],
-                        defaults={'data': evo_data}
-                    )
-
-                # Pokémon
-                pokemon, _ = Pokemon.objects.update_or_create(
-                    id=data['id'],
+            with self._timed('parse'):
+                record = self._parse_pokemon(data, chain_ids_by_url.get(evo_url))
+            if self.sprite_cache:
+                with self._timed('sprites'):
+                    record['sprite_hash'] = self._cache_sprite(record)
+            records.append(record)
+            run.processed += 1
+            run.save(update_fields=['processed', 'updated_at'])
+            metrics.IMPORTED_POKEMON.labels(result='imported').inc()
+        return records, chains
+
+    @staticmethod
+    def _parse_pokemon(data, chain_id):
+        """Keep only the fields we store from a PokéAPI `/pokemon` payload."""
+        return {
+            'id': data['id'],
+            'name': data['name'],
+            'height': data['height'],
+            'weight': data['weight'],
+            'base_experience': data['base_experience'],
+            'sprite_url': data['sprites']['front_default'] or '',
+            'evolution_chain_id': chain_id,
+            'types': [t['type']['name'] for t in data.get('types', [])],
+            'abilities': [a['ability']['name'] for a in data.get('abilities', [])],
+            'stats': [(s['stat']['name'], s['base_stat']) for s in data.get('stats', [])],
+            'moves': PokedexImporter._parse_moves(data.get('moves', [])),
+        }
+
+    @staticmethod
+    def _parse_moves(moves):
+        """
+        Reduce PokéAPI move entries to (move, learn method, level) tuples.
+
+        A move is listed once per version group; the last (most recent) entry
+        for each learn method wins.
+        """
+        learned = {}
+        for entry in moves:
+            for detail in entry.get('version_group_details', []):
+                method = detail['move_learn_method']['name']
+                learned[entry['move']['name'], method] = detail.get('level_learned_at') or 0
+        return [(move, method, level) for (move, method), level in learned.items()]
+
+    def _cache_sprite(self, record):
+        """Download and store the sprite of a parsed record, returning its hash ('' on failure)."""
+        if not record['sprite_url']:
+            return ''
+        try:
+            content = self.client.fetch_bytes(record['sprite_url'])
+            return self.sprite_cache.store(record['id'], content)
+        except (requests.RequestException, OSError) as e:
+            logger.warning(f"Failed to cache sprite of Pokémon {record['id']}: {e}")
+            return ''
+
+    def _publish(self, records, chains):
+        """
+        Write all fetched data and its pre-encoded payloads in one transaction.
+
+        :return: The new dataset version.
+        """
+        with transaction.atomic():
+            # Evolution chains
+            for chain_id, evo_data in chains.items():
+                EvolutionChain.objects.update_or_create(
+                    chain_id=chain_id,
                     defaults={
-                        'name': data['name'],
-                        'height': data['height'],
-                        'weight': data['weight'],
-                        'base_experience': data['base_experience'],
-                        'sprite_url': data['sprites']['front_default'],
-                        'evolution_chain': chain,
+                        'stages': EvolutionChain.stages_from_api(evo_data['chain']),
+                        'raw': (
+                            EvolutionChain.compress_raw(evo_data)
+                            if settings.EVOLUTION_CHAIN_RAW else None
+                        ),
                     }
                 )
 
-                # Types
-                pokemon.types.set(
-                    [self._get_or_create_type(t['type']['name']) for t in data.get('types', [])]
-                )
+            for record in records:
+                self._write_pokemon(record)
+            self._write_moves(records)
 
-                # Abilities
-                pokemon.abilities.set(
-                    [
-                        self._get_or_create_ability(a['ability']['name'])
-                        for a in data.get('abilities', [])
-                    ]
-                )
+            version = DatasetVersion.bump()
+            store_payloads(version)
+            return version
+
+    def _write_pokemon(self, record):
+        # Pokémon
+        defaults = {
+            'name': record['name'],
+            'height': record['height'],
+            'weight': record['weight'],
+            'base_experience': record['base_experience'],
+            'sprite_url': record['sprite_url'],
+            'evolution_chain_id': record['evolution_chain_id'],
+        }
+        if 'sprite_hash' in record:
+            defaults['sprite_hash'] = record['sprite_hash']
+        pokemon, _ = Pokemon.objects.update_or_create(id=record['id'], defaults=defaults)
+
+        # Types
+        pokemon.types.set([self._get_or_create_type(name) for name in record['types']])
+
+        # Abilities
+        pokemon.abilities.set(
+            [self._get_or_create_ability(name) for name in record['abilities']]
+        )
+
+        # Stats
+        PokemonStat.objects.filter(pokemon=pokemon).delete()
+        PokemonStat.objects.bulk_create([
+            PokemonStat(
+                pokemon=pokemon,
+                stat=self._get_or_create_stat(name),
+                base_stat=base_stat
+            )
+            for name, base_stat in record['stats']
+        ])
+
+    def _write_moves(self, records, batch_size=5000):
+        """Replace the learned moves of the given records with bulk inserts."""
+        names = {move for record in records for move, _, _ in record['moves']}
+        missing = names - self.move_cache.keys()
+        if missing:
+            Move.objects.bulk_create([Move(name=name) for name in missing], ignore_conflicts=True)
+            self.move_cache.update(
+                Move.objects.filter(name__in=missing).values_list('name', 'id')
+            )
 
-                # Stats
-                PokemonStat.objects.filter(pokemon=pokemon).delete()
-                stats = []
-                for s in data.get('stats', []):
-                    stat_obj = self._get_or_create_stat(s['stat']['name'])
-                    stats.append(
-                        PokemonStat(
-                            pokemon=pokemon,
-                            stat=stat_obj,
-                            base_stat=s['base_stat']
-                        )
-                    )
-                PokemonStat.objects.bulk_create(stats)
-
-        logger.info("Pokédex import complete.")
\ No newline at end of file
+        PokemonMove.objects.filter(pokemon_id__in=[r['id'] for r in records]).delete()
+        PokemonMove.objects.bulk_create([
+            PokemonMove(
+                pokemon_id=record['id'],
+                move_id=self.move_cache[move],
+                learn_method=method,
+                level=level,
+            )
+            for record in records
+            for move, method, level in record['moves']
+        ], batch_size=batch_size)
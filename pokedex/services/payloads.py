@@ -0,0 +1,133 @@
+"""Module building the JSON payloads returned by the Pokédex API."""
+import orjson
+from django.db.models import Prefetch, Subquery
+
+from pokedex.models import DatasetVersion, Pokemon, PokemonPayload, PokemonStat
+
+from .sprites import SpriteCache
+
+
+def detail_queryset():
+    """Return a Pokémon queryset with everything the detail payload needs preloaded."""
+    return (
+        Pokemon.objects.select_related('evolution_chain')
+        .defer('evolution_chain__raw')
+        .prefetch_related('types', 'abilities')
+    )
+
+
+def compare_queryset():
+    """Return a Pokémon queryset with everything the compare payload needs preloaded."""
+    return Pokemon.objects.prefetch_related(
+        'types',
+        'abilities',
+        Prefetch('pokemonstat_set', queryset=PokemonStat.objects.select_related('stat')),
+    )
+
+
+def sprite_url(pokemon, size='original'):
+    """Return the local URL of a cached sprite, or the upstream URL if it is not cached."""
+    if pokemon.sprite_hash:
+        return SpriteCache.url_for(pokemon.id, size, pokemon.sprite_hash)
+    return pokemon.sprite_url
+
+
+def summary_payload(pokemon):
+    """Serialize a Pokémon as a list entry."""
+    return {'id': pokemon.id, 'name': pokemon.name.title()}
+
+
+def pokemon_payload(pokemon):
+    """Serialize core attributes, types, abilities and sprite URL of a Pokémon."""
+    return {
+        'id': pokemon.id,
+        'name': pokemon.name.title(),
+        'height': pokemon.height,
+        'weight': pokemon.weight,
+        'base_experience': pokemon.base_experience,
+        'types': [t.name for t in pokemon.types.all()],
+        'abilities': [a.name for a in pokemon.abilities.all()],
+        'sprite_url': sprite_url(pokemon),
+        'thumbnail_url': sprite_url(pokemon, 'small'),
+    }
+
+
+def detail_payload(pokemon):
+    """Serialize a Pokémon loaded via `detail_queryset`, including its evolution chain."""
+    data = pokemon_payload(pokemon)
+    data['evolution'] = [stage['name'].title() for stage in pokemon.get_evolution_chain()]
+    return data
+
+
+def compare_payload(pokemon):
+    """Serialize a Pokémon loaded via `compare_queryset`, including its base stats."""
+    data = pokemon_payload(pokemon)
+    data['stats'] = {ps.stat.name: ps.base_stat for ps in pokemon.pokemonstat_set.all()}
+    return data
+
+
+def store_payloads(version, batch_size=1000):
+    """
+    Pre-encode the detail and compare payloads of every Pokémon for a dataset version.
+
+    Replaces all previously stored payloads; call it in the same transaction
+    that publishes `version` so readers never see a mismatched pair.
+
+    :param version: Dataset version the payloads belong to.
+    :param batch_size: Pokémon loaded and rows inserted per batch.
+    :return: Number of payloads stored.
+    """
+    PokemonPayload.objects.all().delete()
+    pokemon = (
+        compare_queryset()
+        .select_related('evolution_chain')
+        .defer('evolution_chain__raw')
+        .order_by('id')
+    )
+    batch = []
+    stored = 0
+    for p in pokemon.iterator(chunk_size=batch_size):
+        batch.append(PokemonPayload(
+            pokemon_id=p.id,
+            dataset_version=version,
+            detail=orjson.dumps(detail_payload(p)),
+            compare=orjson.dumps(compare_payload(p)),
+        ))
+        if len(batch) >= batch_size:
+            stored += len(PokemonPayload.objects.bulk_create(batch))
+            batch = []
+    stored += len(PokemonPayload.objects.bulk_create(batch))
+    return stored
+
+
+def compare_response_body(payload1, payload2):
+    """Join two pre-encoded compare payloads into the compare endpoint's JSON body."""
+    return b'{"pokemon1":%s,"pokemon2":%s}' % (payload1, payload2)
+
+
+def _stored_payloads_queryset(ids, kind, version=None):
+    if version is None:
+        current = DatasetVersion.objects.filter(id=DatasetVersion.SINGLETON_ID).values('version')
+        version = Subquery(current)
+    return PokemonPayload.objects.filter(
+        pokemon_id__in=ids, dataset_version=version
+    ).values_list('pokemon_id', kind)
+
+
+def stored_payloads(ids, kind, version=None):
+    """
+    Return pre-encoded payloads of the current dataset version, in one query.
+
+    :param ids: Pokémon IDs to look up.
+    :param kind: 'detail' or 'compare'.
+    :param version: Current dataset version if already known; looked up in the same query
+        otherwise.
+    :return: Dict mapping Pokémon ID to JSON bytes; IDs without a current payload are missing.
+    """
+    return {pk: bytes(body) for pk, body in _stored_payloads_queryset(ids, kind, version)}
+
+
+async def astored_payloads(ids, kind, version=None):
+    """Async version of `stored_payloads`."""
+    queryset = _stored_payloads_queryset(ids, kind, version)
+    return {pk: bytes(body) async for pk, body in queryset}
@@ -1,8 +1,28 @@
 """Module for interacting with the PokéAPI, providing a retry-enabled HTTP client."""
+import time
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from pokedex import metrics
+
+
+class _CountingRetry(Retry):
+    """Retry policy that reports every retry attempt to the metrics registry."""
+
+    def increment(self, *args, **kwargs):
+        """
+        Defer to urllib3's retry bookkeeping, then count the retry.
+
+        urllib3 also calls this for the final failed attempt, where it raises
+        `MaxRetryError` instead of returning; no retry is made then, so nothing
+        is counted.
+        """
+        retry = super().increment(*args, **kwargs)
+        metrics.POKEAPI_RETRIES.inc()
+        return retry
+
 
 class PokeAPIClient:
     """Client to fetch data from the PokéAPI with retry and session pooling."""
@@ -18,16 +38,18 @@ class PokeAPIClient:
         """
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
-        retries = Retry(
+        retries = _CountingRetry(
             total=max_retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[500, 502, 503, 504],
+            status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"],
         )
         adapter = HTTPAdapter(max_retries=retries)
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         self.timeout = timeout
+        self.requests_made = 0
+        self.decode_seconds = 0.0
 
     def fetch_json(self, path):
         """
@@ -38,9 +60,31 @@ class PokeAPIClient:
         :raises HTTPError: On request failure
         """
         url = f"{self.base_url}/{path.lstrip('/')}"
-        resp = self.session.get(url, timeout=self.timeout)
+        resp = self._get(url)
         resp.raise_for_status()
-        return resp.json()
+        return self._decode(resp)
+
+    def _get(self, url):
+        """Perform a GET request, recording request, failure and byte counts."""
+        metrics.POKEAPI_REQUESTS.inc()
+        self.requests_made += 1
+        try:
+            resp = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            metrics.POKEAPI_FAILURES.inc()
+            raise
+        if not resp.ok:
+            metrics.POKEAPI_FAILURES.inc()
+        metrics.POKEAPI_BYTES.inc(len(resp.content))
+        return resp
+
+    def _decode(self, resp):
+        """Parse a JSON response body, accumulating the time spent in `decode_seconds`."""
+        started = time.perf_counter()
+        try:
+            return resp.json()
+        finally:
+            self.decode_seconds += time.perf_counter() - started
 
     def get_total_count(self):
         """
@@ -67,7 +111,7 @@ class PokeAPIClient:
         :param species_url: Full URL to the species endpoint
         :return: JSON data for the species
         """
-        return self.session.get(species_url, timeout=self.timeout).json()
+        return self._decode(self._get(species_url))
 
     def get_evolution_chain(self, evo_url):
         """
@@ -76,4 +120,16 @@ class PokeAPIClient:
         :param evo_url: Full URL to the evolution chain endpoint
         :return: JSON data for the evolution chain
         """
-        return self.session.get(evo_url, timeout=self.timeout).json()
\ No newline at end of file
+        return self._decode(self._get(evo_url))
+
+    def fetch_bytes(self, url):
+        """
+        Download a binary resource, such as a sprite image, from a full URL.
+
+        :param url: Full URL of the resource
+        :return: Response body as bytes
+        :raises HTTPError: On request failure
+        """
+        resp = self._get(url)
+        resp.raise_for_status()
+        return resp.content
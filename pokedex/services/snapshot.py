@@ -0,0 +1,201 @@
+"""Module for exporting the Pokédex as a columnar Arrow IPC snapshot."""
+import logging
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from django.conf import settings
+
+from pokedex import metrics
+from pokedex.models import DatasetVersion, Pokemon, PokemonStat
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; builds are then not serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class PokedexSnapshot:
+    """
+    Build and locate Arrow IPC snapshots of the Pokédex, keyed by dataset version.
+
+    A snapshot is a directory ``v<version>/`` holding one memory-mappable
+    ``.arrow`` file per table:
+
+    - ``pokemon``: one row per Pokémon with core attributes and one column per stat.
+    - ``pokemon_types``: exploded (pokemon_id, type) pairs.
+    - ``pokemon_abilities``: exploded (pokemon_id, ability) pairs.
+    """
+
+    TABLES = ('pokemon', 'pokemon_types', 'pokemon_abilities')
+    VERSION_DIR = re.compile(r'v(\d+)')
+    MEDIA_TYPE = 'application/vnd.apache.arrow.file'
+
+    def __init__(self, root=None):
+        """
+        Initialize the snapshot store.
+
+        :param root: Directory holding snapshots (defaults to settings.SNAPSHOT_DIR).
+        """
+        self.root = Path(root or settings.SNAPSHOT_DIR)
+
+    def directory_for(self, version):
+        """Return the snapshot directory for the given dataset version."""
+        return self.root / f"v{version}"
+
+    def path_for(self, table, version):
+        """Return the path of a snapshot table file for the given dataset version."""
+        return self.directory_for(version) / f"{table}.arrow"
+
+    def ensure(self, version=None):
+        """
+        Return the snapshot directory for a dataset version, building it if missing.
+
+        Builds are serialized with a file lock, so concurrent workers missing the
+        same version wait for one build instead of each exporting every table.
+
+        :param version: Dataset version (defaults to the current one).
+        :return: Path to the snapshot directory.
+        """
+        version = DatasetVersion.current() if version is None else version
+        directory = self.directory_for(version)
+        hit = directory.is_dir()
+        metrics.record_cache('snapshot', hit)
+        if not hit:
+            with self._build_lock():
+                if not directory.is_dir():
+                    self._build(version)
+        return directory
+
+    def build(self, version):
+        """
+        Write all snapshot tables for a dataset version, replacing an existing snapshot.
+
+        Tables are written to a temporary directory which is renamed into place,
+        so readers never see a partially written snapshot. Older versions are
+        removed afterwards.
+
+        :param version: Dataset version the snapshot is keyed by.
+        :return: Path to the snapshot directory.
+        """
+        with self._build_lock():
+            return self._build(version)
+
+    @contextmanager
+    def _build_lock(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / '.build.lock', 'w') as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            yield  # closing the file releases the lock
+
+    def _build(self, version):
+        directory = self.directory_for(version)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".v{version}-", dir=self.root))
+        try:
+            for name, table in self._build_tables().items():
+                with pa.OSFile(str(tmp_dir / f"{name}.arrow"), 'wb') as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            self._publish(tmp_dir, directory)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self._prune(older_than=version)
+        logger.info(f"Built Pokédex snapshot for dataset version {version}")
+        return directory
+
+    def _publish(self, tmp_dir, directory):
+        stale = None
+        if directory.is_dir():
+            stale = Path(tempfile.mkdtemp(prefix='.stale-', dir=self.root))
+            directory.rename(stale / directory.name)
+        try:
+            tmp_dir.rename(directory)
+        except OSError:
+            # Another process published the same version first.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        if stale:
+            shutil.rmtree(stale, ignore_errors=True)
+
+    def _prune(self, older_than):
+        # Never remove newer versions: a slow build of an old version may finish last.
+        for path in self.root.iterdir():
+            match = self.VERSION_DIR.fullmatch(path.name)
+            if match and path.is_dir() and int(match.group(1)) < older_than:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _build_tables(self):
+        return {
+            'pokemon': self._pokemon_table(),
+            'pokemon_types': self._exploded_table('types__name', 'type'),
+            'pokemon_abilities': self._exploded_table('abilities__name', 'ability'),
+        }
+
+    def _pokemon_table(self):
+        columns = {
+            'id': [],
+            'name': [],
+            'height': [],
+            'weight': [],
+            'base_experience': [],
+            'sprite_url': [],
+            'evolution_chain_id': [],
+        }
+        rows = Pokemon.objects.order_by('id').values_list(
+            'id', 'name', 'height', 'weight', 'base_experience', 'sprite_url',
+            'evolution_chain_id',
+        )
+        for row in rows.iterator(chunk_size=5000):
+            for key, value in zip(columns, row):
+                columns[key].append(value)
+
+        stats = {}
+        stat_rows = PokemonStat.objects.values_list('pokemon_id', 'stat__name', 'base_stat')
+        for pokemon_id, stat_name, base_stat in stat_rows.iterator(chunk_size=5000):
+            stats.setdefault(stat_name, {})[pokemon_id] = base_stat
+
+        schema = [
+            pa.field('id', pa.uint32(), nullable=False),
+            pa.field('name', pa.string(), nullable=False),
+            pa.field('height', pa.int32()),
+            pa.field('weight', pa.int32()),
+            pa.field('base_experience', pa.int32()),
+            pa.field('sprite_url', pa.string()),
+            pa.field('evolution_chain_id', pa.uint32()),
+        ]
+        for stat_name in sorted(stats):
+            values = stats[stat_name]
+            columns[stat_name] = [values.get(pid) for pid in columns['id']]
+            schema.append(pa.field(stat_name, pa.int32()))
+
+        return pa.Table.from_pydict(columns, schema=pa.schema(schema))
+
+    def _exploded_table(self, lookup, column):
+        pokemon_ids = []
+        names = []
+        rows = (
+            Pokemon.objects.filter(**{f'{lookup}__isnull': False})
+            .order_by('id', lookup)
+            .values_list('id', lookup)
+        )
+        for pokemon_id, name in rows.iterator(chunk_size=5000):
+            pokemon_ids.append(pokemon_id)
+            names.append(name)
+
+        table = pa.Table.from_pydict(
+            {'pokemon_id': pokemon_ids, column: names},
+            schema=pa.schema([
+                pa.field('pokemon_id', pa.uint32(), nullable=False),
+                pa.field(column, pa.string(), nullable=False),
+            ]),
+        )
+        # Few distinct names repeated many times: dictionary-encode them.
+        return table.set_column(1, column, pc.dictionary_encode(table.column(column)))
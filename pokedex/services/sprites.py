@@ -0,0 +1,108 @@
+"""Module for caching Pokémon sprites and their thumbnails on local storage."""
+import hashlib
+import io
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.urls import reverse
+from PIL import Image
+
+
+class SpriteCache:
+    """
+    Store downloaded sprites and resized thumbnails under ``<root>/<id>/<hash>/<size>.png``.
+
+    Each stored sprite is identified by a short content hash, which callers keep
+    alongside the Pokémon. The hash is part of both the file path and the URL, so
+    a URL always serves the same bytes and can be cached forever, and a re-import
+    never changes the files behind already published URLs.
+    """
+
+    # Size name -> max edge in pixels (None keeps the original image).
+    SIZES = {'original': None, 'small': 48}
+    HASH_PATTERN = re.compile(r'[0-9a-f]{12}')
+
+    def __init__(self, root=None):
+        """
+        Initialize the sprite cache.
+
+        :param root: Directory holding sprites (defaults to settings.SPRITE_ROOT).
+        """
+        self.root = Path(root or settings.SPRITE_ROOT)
+
+    def path_for(self, pokemon_id, content_hash, size):
+        """Return the file path of a version of a Pokémon sprite in the given size."""
+        return self.root / str(pokemon_id) / content_hash / f"{size}.png"
+
+    @staticmethod
+    def url_for(pokemon_id, size, content_hash):
+        """Return the content-addressed URL serving a cached sprite."""
+        return reverse('pokemon-sprite', args=[pokemon_id, content_hash, size])
+
+    def store(self, pokemon_id, content):
+        """
+        Save a sprite and generate all thumbnail sizes.
+
+        :param pokemon_id: ID of the Pokémon the sprite belongs to.
+        :param content: Raw image bytes as downloaded.
+        :return: Short content hash identifying this version of the sprite.
+        :raises PIL.UnidentifiedImageError: If the content is not an image.
+        """
+        content_hash = hashlib.sha1(content).hexdigest()[:12]
+        paths = {size: self.path_for(pokemon_id, content_hash, size) for size in self.SIZES}
+        if all(path.exists() for path in paths.values()):
+            return content_hash
+        with Image.open(io.BytesIO(content)) as image:
+            image.load()
+            for size, edge in self.SIZES.items():
+                variant = image.copy()
+                if edge:
+                    # Pixel art: nearest-neighbour keeps the edges crisp.
+                    variant.thumbnail((edge, edge), Image.Resampling.NEAREST)
+                self._write(paths[size], variant)
+        return content_hash
+
+    def prune(self, referenced, older_than=None):
+        """
+        Delete stored sprite versions that no Pokémon references any more.
+
+        :param referenced: Mapping of Pokémon ID to the content hash it links to.
+        :param older_than: Only delete versions written before this POSIX timestamp,
+            so sprites stored by an import that has not published yet survive.
+        :return: Number of sprite versions deleted.
+        """
+        if not self.root.is_dir():
+            return 0
+        removed = 0
+        for pokemon_dir in self.root.iterdir():
+            if not (pokemon_dir.is_dir() and pokemon_dir.name.isdigit()):
+                continue
+            keep = referenced.get(int(pokemon_dir.name))
+            for version_dir in pokemon_dir.iterdir():
+                if (
+                    version_dir.name == keep
+                    or not version_dir.is_dir()
+                    or not self.HASH_PATTERN.fullmatch(version_dir.name)
+                    or (older_than is not None and version_dir.stat().st_mtime >= older_than)
+                ):
+                    continue
+                shutil.rmtree(version_dir, ignore_errors=True)
+                removed += 1
+        return removed
+
+    @staticmethod
+    def _write(path, image):
+        """Write a PNG atomically so concurrent readers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix='.png', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                image.save(fh, format='PNG', optimize=True)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,105 @@
+// Client-side cache for read API responses, shared by the Pokédex and compare pages.
+//
+// Responses are kept in memory and, when available, in IndexedDB, keyed by URL
+// and tagged with the dataset version reported by /api/bootstrap/. A new
+// import bumps the version, so everything cached for older versions is dropped
+// on the next page load.
+window.PokedexCache = (() => {
+  const DB_NAME = 'pokedex-cache';
+  const STORE   = 'responses';
+
+  const memory   = new Map();
+  const inflight = new Map();
+  let version = null;
+  let dbPromise = null;
+
+  function openDb() {
+    if (!('indexedDB' in window)) return Promise.resolve(null);
+    return new Promise(resolve => {
+      const req = indexedDB.open(DB_NAME, 1);
+      req.onupgradeneeded = () => req.result.createObjectStore(STORE, { keyPath: 'url' });
+      req.onsuccess = () => resolve(req.result);
+      req.onerror   = () => resolve(null);  // e.g. private browsing: memory cache only
+    });
+  }
+
+  function withStore(mode, fn) {
+    return (dbPromise || Promise.resolve(null)).then(db => {
+      if (!db) return null;
+      return new Promise(resolve => {
+        const tx  = db.transaction(STORE, mode);
+        const req = fn(tx.objectStore(STORE));
+        tx.oncomplete = () => resolve(req ? req.result : null);
+        tx.onerror    = () => resolve(null);
+      });
+    });
+  }
+
+  function dropOtherVersions() {
+    return withStore('readwrite', store => {
+      store.openCursor().onsuccess = e => {
+        const cursor = e.target.result;
+        if (!cursor) return;
+        if (cursor.value.version !== version) cursor.delete();
+        cursor.continue();
+      };
+    });
+  }
+
+  function remember(url, data) {
+    memory.set(url, data);
+    withStore('readwrite', store => store.put({ url, version, data }));
+  }
+
+  // Fetch /api/bootstrap/ once per page load and seed the cache with its first list page.
+  function bootstrap(limit) {
+    dbPromise = dbPromise || openDb();
+    return fetch(`/api/bootstrap/?limit=${limit}`)
+      .then(r => {
+        if (!r.ok) throw new Error(`HTTP ${r.status}`);
+        return r.json();
+      })
+      .then(data => {
+        version = data.dataset_version;
+        dropOtherVersions();
+        remember(`/api/pokemon/?page=1&limit=${limit}`, data.pokemon);
+        return data;
+      });
+  }
+
+  // Return the JSON for a GET URL from memory, IndexedDB or the network, in that order.
+  function get(url) {
+    if (memory.has(url)) return Promise.resolve(memory.get(url));
+    if (inflight.has(url)) return inflight.get(url);
+
+    const stored = version === null
+      ? Promise.resolve(null)
+      : withStore('readonly', store => store.get(url));
+    const promise = stored
+      .then(entry => {
+        if (entry && entry.version === version) {
+          memory.set(url, entry.data);
+          return entry.data;
+        }
+        return fetch(url)
+          .then(r => {
+            if (!r.ok) throw new Error(`HTTP ${r.status}`);
+            return r.json();
+          })
+          .then(data => {
+            remember(url, data);
+            return data;
+          });
+      })
+      .finally(() => inflight.delete(url));
+    inflight.set(url, promise);
+    return promise;
+  }
+
+  // Warm the cache for a URL the user is likely to request next.
+  function prefetch(url) {
+    get(url).catch(() => {});
+  }
+
+  return { bootstrap, get, prefetch };
+})();
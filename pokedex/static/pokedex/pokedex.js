@@ -12,34 +12,31 @@ document.addEventListener('DOMContentLoaded', () => {
   const applyBtn      = document.getElementById('apply-filters');
   const clearBtn      = document.getElementById('clear-filters');
 
+  const cache = window.PokedexCache;
+
   let currentPage = 1;
   const limit = 20;
   let totalPages = 1;
 
+  function fillOptions(selectEl, items) {
+    selectEl.innerHTML = '';
+    items.forEach(item => {
+      const opt = document.createElement('option');
+      opt.value = item.name;
+      opt.textContent = item.name;
+      selectEl.appendChild(opt);
+    });
+  }
+
   function loadOptions(url, selectEl) {
-    fetch(url)
-      .then(r => {
-        if (!r.ok) throw new Error(`HTTP ${r.status}`);
-        return r.json();
-      })
-      .then(data => {
-        selectEl.innerHTML = '';
-        data.forEach(item => {
-          const opt = document.createElement('option');
-          opt.value = item.name;
-          opt.textContent = item.name;
-          selectEl.appendChild(opt);
-        });
-      })
+    cache.get(url)
+      .then(data => fillOptions(selectEl, data))
       .catch(err => {
         console.error(`Error loading options from ${url}:`, err);
       });
   }
 
-  loadOptions('/api/types/',    typeSelect);
-  loadOptions('/api/abilities/', abilitySelect);
-
-  function fetchList(page) {
+  function listUrl(page) {
     const params = new URLSearchParams();
     params.set('page',  page);
     params.set('limit', limit);
@@ -53,12 +50,15 @@ document.addEventListener('DOMContentLoaded', () => {
     Array.from(abilitySelect.selectedOptions).forEach(opt =>
       params.append('ability', opt.value)
     );
+    return `/api/pokemon/?${params.toString()}`;
+  }
 
-    fetch(`/api/pokemon/?${params.toString()}`)
-      .then(r => {
-        if (!r.ok) throw new Error(`HTTP ${r.status}`);
-        return r.json();
-      })
+  function detailUrl(id) {
+    return `/api/pokemon/${id}/`;
+  }
+
+  function fetchList(page) {
+    cache.get(listUrl(page))
       .then(data => {
         listEl.innerHTML = '';
         data.results.forEach(poke => {
@@ -71,6 +71,8 @@ document.addEventListener('DOMContentLoaded', () => {
             e.preventDefault();
             fetchDetail(e.target.dataset.id);
           });
+          // Hovering usually precedes a click, so start loading the detail early.
+          a.addEventListener('mouseenter', () => cache.prefetch(detailUrl(poke.id)));
           li.appendChild(a);
           listEl.appendChild(li);
         });
@@ -80,6 +82,8 @@ document.addEventListener('DOMContentLoaded', () => {
         pageIndicator.textContent = `Page ${currentPage} of ${totalPages}`;
         prevBtn.disabled = currentPage <= 1;
         nextBtn.disabled = currentPage >= totalPages;
+
+        if (currentPage < totalPages) cache.prefetch(listUrl(currentPage + 1));
       })
       .catch(err => {
         console.error('Error fetching list:', err);
@@ -88,11 +92,7 @@ document.addEventListener('DOMContentLoaded', () => {
   }
 
   function fetchDetail(id) {
-    fetch(`/api/pokemon/${id}/`)
-      .then(r => {
-        if (!r.ok) throw new Error(`HTTP ${r.status}`);
-        return r.json();
-      })
+    cache.get(detailUrl(id))
       .then(p => {
         let html = `
           <h3>${p.name}</h3>
@@ -135,5 +135,17 @@ document.addEventListener('DOMContentLoaded', () => {
     fetchList(1);
   });
 
-  fetchList(currentPage);
-});
\ No newline at end of file
+  // One request for filters and the first page; the list page is then served from the cache.
+  cache.bootstrap(limit)
+    .then(data => {
+      fillOptions(typeSelect,    data.types);
+      fillOptions(abilitySelect, data.abilities);
+      fetchList(currentPage);
+    })
+    .catch(err => {
+      console.error('Error loading bootstrap data:', err);
+      loadOptions('/api/types/',     typeSelect);
+      loadOptions('/api/abilities/', abilitySelect);
+      fetchList(currentPage);
+    });
+});
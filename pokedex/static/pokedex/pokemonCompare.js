@@ -6,12 +6,28 @@ document.addEventListener('DOMContentLoaded', () => {
   const compare  = document.getElementById('compare-btn');
   const resultEl = document.getElementById('compare-result');
 
+  const cache = window.PokedexCache;
+  // Tags cached responses with the dataset version and seeds the first search page.
+  const ready = cache.bootstrap(20).catch(err => console.error('Bootstrap error:', err));
+
   const map1 = new Map();
   const map2 = new Map();
 
   setupDatalist(input1, data1, map1);
   setupDatalist(input2, data2, map2);
 
+  function compareUrl() {
+    const id1 = map1.get(input1.value.trim());
+    const id2 = map2.get(input2.value.trim());
+    return id1 && id2 && id1 !== id2 ? `/api/pokemon/compare/?id1=${id1}&id2=${id2}` : null;
+  }
+
+  // Start loading the comparison as soon as both Pokémon are picked.
+  [input1, input2].forEach(el => el.addEventListener('change', () => {
+    const url = compareUrl();
+    if (url) cache.prefetch(url);
+  }));
+
   compare.addEventListener('click', () => {
     const name1 = input1.value.trim();
     const name2 = input2.value.trim();
@@ -27,8 +43,7 @@ document.addEventListener('DOMContentLoaded', () => {
       return;
     }
 
-    fetch(`/api/pokemon/compare/?id1=${id1}&id2=${id2}`)
-      .then(r => r.ok ? r.json() : Promise.reject(r.status))
+    cache.get(compareUrl())
       .then(({ pokemon1, pokemon2 }) => {
         resultEl.innerHTML = `
           <div class="compare-cards">
@@ -70,8 +85,8 @@ document.addEventListener('DOMContentLoaded', () => {
       const url = q
         ? `/api/pokemon/?search=${encodeURIComponent(q)}&page=1&limit=20`
         : `/api/pokemon/?page=1&limit=20`;
-      fetch(url)
-        .then(r => r.ok ? r.json() : Promise.reject(r.status))
+      ready
+        .then(() => cache.get(url))
         .then(data => {
           datalistEl.innerHTML = '';
           map.clear();
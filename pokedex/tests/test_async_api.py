@@ -0,0 +1,61 @@
+"""Tests for the async (ASGI) read API endpoints."""
+from django.test import TestCase
+from django.urls import reverse
+
+from pokedex.models import Ability, EvolutionChain, Pokemon, PokemonStat, Stat, Type
+
+
+class TestAsyncAPI(TestCase):
+    """The async endpoints should return the same payloads as their sync counterparts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create an evolution line of two Pokémon with types, abilities and stats."""
+        fire = Type.objects.create(name="fire")
+        blaze = Ability.objects.create(name="blaze")
+        hp = Stat.objects.create(name="hp")
+        chain = EvolutionChain.objects.create(chain_id=2, stages=EvolutionChain.stages_from_api({
+            'species': {'name': 'charmander'},
+            'evolves_to': [{'species': {'name': 'charmeleon'}, 'evolves_to': []}],
+        }))
+        for pid, name, base_hp in [(4, 'charmander', 39), (5, 'charmeleon', 58)]:
+            p = Pokemon.objects.create(
+                id=pid, name=name, height=6, weight=85, base_experience=62,
+                evolution_chain=chain,
+            )
+            p.types.add(fire)
+            p.abilities.add(blaze)
+            PokemonStat.objects.create(pokemon=p, stat=hp, base_stat=base_hp)
+
+    async def _assert_same(self, sync_name, async_name, args=None, params=None):
+        sync_response = await self.async_client.get(reverse(sync_name, args=args), params)
+        async_response = await self.async_client.get(reverse(async_name, args=args), params)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.json(), sync_response.json())
+        return async_response.json()
+
+    async def test_list(self):
+        """The async list should filter and paginate like the sync one."""
+        data = await self._assert_same(
+            'api-pokemon-list', 'api-async-pokemon-list', params={'type': 'fire', 'limit': 1}
+        )
+        self.assertEqual(data, {'results': [{'id': 4, 'name': 'Charmander'}], 'count': 2})
+
+    async def test_detail(self):
+        """The async detail should include the flattened evolution chain."""
+        data = await self._assert_same('api-pokemon-detail', 'api-async-pokemon-detail', args=[5])
+        self.assertEqual(data['evolution'], ['Charmander', 'Charmeleon'])
+        await self._assert_same('api-pokemon-detail', 'api-async-pokemon-detail', args=[999])
+
+    async def test_compare(self):
+        """The async compare should include stats, and validate its parameters."""
+        data = await self._assert_same(
+            'api-pokemon-compare', 'api-async-pokemon-compare', params={'id1': 4, 'id2': 5}
+        )
+        self.assertEqual(data['pokemon2']['stats'], {'hp': 58})
+        await self._assert_same('api-pokemon-compare', 'api-async-pokemon-compare', params={})
+
+    async def test_types_and_abilities(self):
+        """The async filter option endpoints should list all names."""
+        await self._assert_same('api-type-list', 'api-async-type-list')
+        await self._assert_same('api-ability-list', 'api-async-ability-list')
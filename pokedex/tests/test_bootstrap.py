@@ -0,0 +1,44 @@
+"""Tests for the SPA bootstrap endpoint."""
+from django.test import TestCase
+from django.urls import reverse
+
+from pokedex.models import Ability, DatasetVersion, Pokemon, Type
+
+
+class TestBootstrapAPI(TestCase):
+    """Test cases for `GET /api/bootstrap/`."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create three Pokémon, two types and an ability."""
+        Type.objects.create(name='water')
+        Type.objects.create(name='fire')
+        Ability.objects.create(name='torrent')
+        for pid, name in ((7, 'squirtle'), (8, 'wartortle'), (9, 'blastoise')):
+            Pokemon.objects.create(id=pid, name=name, height=1, weight=1, base_experience=1)
+
+    def test_bootstrap_matches_first_list_page(self):
+        """Filters, version and the first list page should come back in one response."""
+        url = reverse('api-bootstrap')
+        response = self.client.get(url, {'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['dataset_version'], DatasetVersion.current())
+        self.assertEqual([t['name'] for t in data['types']], ['fire', 'water'])
+        self.assertEqual([a['name'] for a in data['abilities']], ['torrent'])
+        first_page = self.client.get(reverse('api-pokemon-list'), {'page': 1, 'limit': 2})
+        self.assertEqual(data['pokemon'], first_page.json())
+
+    def test_etag_follows_dataset_version(self):
+        """An unchanged dataset should revalidate with a 304 until the version is bumped."""
+        url = reverse('api-bootstrap')
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        DatasetVersion.bump()
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
@@ -0,0 +1,101 @@
+"""Tests for cached compressed API responses."""
+import gzip
+
+import brotli
+from django.conf import settings
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from pokedex.models import DatasetVersion, Type
+from pokedex.services.compression import negotiate_encoding
+
+GZIP = {'Accept-Encoding': 'gzip, deflate'}
+
+
+class TestNegotiateEncoding(SimpleTestCase):
+    """Test cases for Accept-Encoding negotiation."""
+
+    def test_quality_values(self):
+        """Refused or unsupported codings should never be picked."""
+        self.assertEqual(negotiate_encoding('gzip, deflate'), 'gzip')
+        self.assertEqual(negotiate_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(negotiate_encoding('*'), 'br')
+        self.assertEqual(negotiate_encoding('br;q=0.5, gzip'), 'gzip')
+        self.assertEqual(negotiate_encoding('*, br;q=0'), 'gzip')
+        self.assertIsNone(negotiate_encoding(''))
+        self.assertIsNone(negotiate_encoding('deflate, identity'))
+        self.assertIsNone(negotiate_encoding('gzip;q=0, br;q=0'))
+
+
+class TestCompressionMiddleware(TestCase):
+    """Test cases for serving cached compressed variants."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create enough types for the type list to be worth compressing."""
+        Type.objects.bulk_create(Type(name=f'type-{i:02}') for i in range(30))
+
+    def setUp(self):
+        """Start every test with an empty variant cache."""
+        caches[settings.COMPRESSED_RESPONSE_CACHE].clear()
+
+    def test_variant_is_cached_per_dataset_version(self):
+        """Hits should skip the view and a version bump should expose new data."""
+        url = reverse('api-type-list')
+        plain = self.client.get(url)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        first = self.client.get(url, headers=GZIP)
+        self.assertEqual(first['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', first['Vary'])
+        self.assertEqual(gzip.decompress(first.content), plain.content)
+        self.assertLess(len(first.content), len(plain.content))
+
+        Type.objects.create(name='zzz')
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, headers=GZIP)
+        self.assertEqual(cached.content, first.content)
+
+        DatasetVersion.bump()
+        fresh = self.client.get(url, headers=GZIP)
+        self.assertIn(b'zzz', gzip.decompress(fresh.content))
+
+    def test_brotli_is_preferred_and_cached(self):
+        """Clients accepting brotli should get a cached br variant that round-trips."""
+        url = reverse('api-type-list')
+        plain = self.client.get(url)
+        headers = {'Accept-Encoding': 'gzip, deflate, br'}
+        first = self.client.get(url, headers=headers)
+        self.assertEqual(first['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(first.content), plain.content)
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, headers=headers)
+        self.assertEqual(cached['Content-Encoding'], 'br')
+        self.assertEqual(cached.content, first.content)
+        # The gzip variant is cached separately.
+        self.assertEqual(self.client.get(url, headers=GZIP)['Content-Encoding'], 'gzip')
+
+    def test_small_and_uncacheable_responses_pass_through(self):
+        """Tiny bodies and errors should be sent uncompressed and not cached."""
+        empty = self.client.get(reverse('api-ability-list'), headers=GZIP)
+        self.assertFalse(empty.has_header('Content-Encoding'))
+        missing = self.client.get(reverse('api-pokemon-detail', args=[999]), headers=GZIP)
+        self.assertEqual(missing.status_code, 404)
+        self.assertFalse(missing.has_header('Content-Encoding'))
+
+    def test_cached_bootstrap_revalidates(self):
+        """A cached variant should still answer a matching If-None-Match with a 304."""
+        url = reverse('api-bootstrap')
+        etag = self.client.get(url, headers=GZIP)['ETag']
+        response = self.client.get(url, headers={**GZIP, 'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    async def test_async_views_are_compressed(self):
+        """Async endpoints should share the compressed variants mechanism."""
+        response = await self.async_client.get(reverse('api-async-type-list'), headers=GZIP)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn(b'type-00', gzip.decompress(response.content))
@@ -0,0 +1,45 @@
+"""Tests for the synthetic Pokédex generator."""
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+from django.test import TestCase
+from django.urls import reverse
+
+from pokedex.models import DatasetVersion, EvolutionChain, Pokemon, PokemonStat, Type
+
+
+class TestGeneratePokedex(TestCase):
+    """Test cases for the generate_pokedex command."""
+
+    def generate(self, *args):
+        """Run the command quietly with the given arguments."""
+        call_command('generate_pokedex', *args, stdout=StringIO())
+
+    def test_generates_requested_size_and_distribution(self):
+        """Every Pokémon should get stats, types and a chain, following the requested shape."""
+        self.generate(
+            '--size', '200', '--chain-length', '4', '--dual-type-ratio', '0',
+            '--type-skew', '2', '--batch-size', '50',
+        )
+
+        self.assertEqual(Pokemon.objects.count(), 200)
+        self.assertEqual(PokemonStat.objects.count(), 200 * 6)
+        self.assertEqual(EvolutionChain.objects.count(), 50)
+        self.assertEqual(Pokemon.types.through.objects.count(), 200)
+        counts = Type.objects.annotate(n=Count('pokemon')).order_by('-n')
+        self.assertGreater(counts[0].n, 200 / len(counts) * 2)
+        self.assertEqual(DatasetVersion.current(), 1)
+
+        response = self.client.get(reverse('api-pokemon-detail', args=[8]))
+        self.assertEqual(len(response.json()['evolution']), 4)
+
+    def test_refuses_to_overwrite_without_clear(self):
+        """Existing data should only be replaced when --clear is passed."""
+        self.generate('--size', '10')
+        with self.assertRaises(CommandError):
+            self.generate('--size', '10')
+
+        self.generate('--size', '20', '--seed', '1', '--clear')
+        self.assertEqual(Pokemon.objects.count(), 20)
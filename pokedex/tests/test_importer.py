@@ -0,0 +1,239 @@
+"""Tests for the Pokédex importer and the import status endpoint."""
+from datetime import timedelta
+from unittest import mock
+
+import requests
+from django.apps import apps
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from pokedex.models import DatasetVersion, EvolutionChain, ImportRun, Pokemon, PokemonMove
+from pokedex.services import PokedexImporter
+
+BASE = 'http://pokeapi.test/api/v2'
+
+
+class FakePokeAPIClient:
+    """In-memory stand-in for PokeAPIClient serving a tiny Pokédex."""
+
+    def __init__(self, missing=()):
+        """Serve Pokémon 1-3 sharing one evolution chain, except the `missing` IDs."""
+        self.missing = set(missing)
+        self.evolution_calls = 0
+
+    def get_total_count(self):
+        """Return the number of Pokémon in the fake API."""
+        return 3
+
+    def get_pokemon(self, pokemon_id):
+        """Return a minimal `/pokemon/<id>` payload, or raise HTTPError for missing IDs."""
+        if pokemon_id in self.missing:
+            raise requests.HTTPError(f'404 for {pokemon_id}')
+        return {
+            'id': pokemon_id,
+            'name': f'mon-{pokemon_id}',
+            'height': 10,
+            'weight': 100,
+            'base_experience': 50,
+            'sprites': {'front_default': None},
+            'species': {'url': f'{BASE}/pokemon-species/{pokemon_id}/'},
+            'types': [{'type': {'name': 'grass'}}],
+            'abilities': [{'ability': {'name': 'overgrow'}}],
+            'stats': [{'stat': {'name': 'hp'}, 'base_stat': 40 + pokemon_id}],
+            'moves': [
+                {'move': {'name': 'tackle'}, 'version_group_details': [
+                    {'level_learned_at': 1, 'move_learn_method': {'name': 'level-up'}},
+                    {'level_learned_at': 3, 'move_learn_method': {'name': 'level-up'}},
+                ]},
+                {'move': {'name': 'solar-beam'}, 'version_group_details': [
+                    {'level_learned_at': 0, 'move_learn_method': {'name': 'machine'}},
+                    {
+                        'level_learned_at': 40 + pokemon_id,
+                        'move_learn_method': {'name': 'level-up'},
+                    },
+                ]},
+            ],
+        }
+
+    def get_species(self, species_url):
+        """Return a species payload pointing at the shared evolution chain."""
+        return {'evolution_chain': {'url': f'{BASE}/evolution-chain/1/'}}
+
+    def get_evolution_chain(self, evo_url):
+        """Return the shared evolution chain payload."""
+        self.evolution_calls += 1
+        return {'id': 1, 'chain': {
+            'species': {'name': 'mon-1', 'url': f'{BASE}/pokemon-species/1/'},
+            'evolution_details': [],
+            'evolves_to': [{
+                'species': {'name': 'mon-3', 'url': f'{BASE}/pokemon-species/3/'},
+                'evolution_details': [{
+                    'trigger': {'name': 'use-item', 'url': f'{BASE}/evolution-trigger/3/'},
+                    'item': {'name': 'leaf-stone', 'url': f'{BASE}/item/85/'},
+                    'min_level': None,
+                }],
+                'evolves_to': [],
+            }],
+        }}
+
+
+class TestPokedexImporter(TestCase):
+    """Test cases for the two-phase importer."""
+
+    def test_import_publishes_data_and_records_run(self):
+        """A run should write all Pokémon, bump the version and record its progress."""
+        client = FakePokeAPIClient(missing={2})
+        with self.assertLogs('pokedex.services.importer', level='ERROR'):
+            run = PokedexImporter(client=client).import_range()
+
+        self.assertEqual(run.status, ImportRun.Status.SUCCEEDED)
+        self.assertEqual((run.total, run.processed, run.failed), (3, 2, 1))
+        self.assertEqual(run.dataset_version, DatasetVersion.current())
+        self.assertEqual(list(Pokemon.objects.values_list('id', flat=True)), [1, 3])
+        self.assertEqual(EvolutionChain.objects.count(), 1)
+        # The shared evolution chain is only downloaded once.
+        self.assertEqual(client.evolution_calls, 1)
+
+    def test_failed_publish_leaves_previous_data(self):
+        """If the write phase fails, nothing from the run should be published."""
+        importer = PokedexImporter(client=FakePokeAPIClient())
+        with mock.patch.object(importer, '_write_pokemon', side_effect=ValueError('boom')):
+            with self.assertRaises(ValueError):
+                importer.import_range()
+
+        run = ImportRun.objects.get()
+        self.assertEqual(run.status, ImportRun.Status.FAILED)
+        self.assertEqual(run.error, 'boom')
+        self.assertFalse(EvolutionChain.objects.exists())
+        self.assertEqual(DatasetVersion.current(), 0)
+
+    def test_moves_are_imported_and_filterable(self):
+        """Moves should be stored once per learn method and be usable as a list filter."""
+        PokedexImporter(client=FakePokeAPIClient(missing={2})).import_range()
+        learned = PokemonMove.objects.filter(pokemon_id=3).values_list(
+            'move__name', 'learn_method', 'level'
+        )
+        self.assertCountEqual(learned, [
+            ('tackle', 'level-up', 3),
+            ('solar-beam', 'machine', 0),
+            ('solar-beam', 'level-up', 43),
+        ])
+
+        response = self.client.get(reverse('api-pokemon-list'), {'move': 'solar-beam'})
+        self.assertEqual(response.json()['count'], 2)
+        self.assertEqual([p['id'] for p in response.json()['results']], [1, 3])
+
+    def test_evolution_chains_are_stored_compactly(self):
+        """Chains should be reduced to stages; the raw payload is only kept when enabled."""
+        PokedexImporter(client=FakePokeAPIClient()).import_range()
+        chain = EvolutionChain.objects.get()
+        self.assertEqual(chain.stages, [
+            EvolutionChain.stage(1, 'mon-1'),
+            EvolutionChain.stage(
+                3, 'mon-3', parent_id=1, parent='mon-1', trigger='use-item', item='leaf-stone'
+            ),
+        ])
+        self.assertIsNone(chain.raw_data())
+        data = self.client.get(reverse('api-pokemon-detail', args=[3])).json()
+        self.assertEqual(data['evolution'], ['Mon-1', 'Mon-3'])
+
+        with override_settings(EVOLUTION_CHAIN_RAW=True):
+            PokedexImporter(client=FakePokeAPIClient()).import_range()
+        raw = EvolutionChain.objects.get().raw_data()
+        self.assertEqual(raw, FakePokeAPIClient().get_evolution_chain(None))
+
+    def test_stages_link_parents_without_species_ids(self):
+        """Stages below a species without a URL should still name the species they evolve from."""
+        stages = EvolutionChain.stages_from_api({
+            'species': {'name': 'wurmple'},
+            'evolves_to': [
+                {'species': {'name': 'silcoon'}, 'evolves_to': [
+                    {'species': {'name': 'beautifly', 'url': f'{BASE}/pokemon-species/267/'}},
+                ]},
+                {'species': {'name': 'cascoon', 'url': f'{BASE}/pokemon-species/268/'}},
+            ],
+        })
+        self.assertEqual(
+            [(s['name'], s['parent'], s['parent_id']) for s in stages],
+            [
+                ('wurmple', None, None),
+                ('silcoon', 'wurmple', None),
+                ('beautifly', 'silcoon', None),
+                ('cascoon', 'wurmple', None),
+            ],
+        )
+        self.assertEqual(stages[2]['species_id'], 267)
+
+    def test_status_endpoint_reports_latest_run(self):
+        """The status endpoint should expose the latest run's progress and the dataset version."""
+        response = self.client.get(reverse('api-import-status'))
+        self.assertEqual(response.json()['import'], None)
+
+        PokedexImporter(client=FakePokeAPIClient()).import_range(limit=2)
+        data = self.client.get(reverse('api-import-status')).json()
+        self.assertEqual(data['dataset_version'], 1)
+        self.assertEqual(data['pokemon_count'], 2)
+        self.assertEqual(data['import']['status'], 'succeeded')
+        self.assertEqual(data['import']['progress'], 1.0)
+        # Datetimes keep DRF's encoding: millisecond precision and a `Z` suffix for UTC.
+        run = ImportRun.objects.get()
+        self.assertEqual(data['import']['started_at'], JSONEncoder().default(run.started_at))
+        self.assertTrue(data['import']['finished_at'].endswith('Z'))
+
+    def test_new_run_fails_interrupted_runs(self):
+        """Runs without recent progress should be failed when a new run starts."""
+        stuck = ImportRun.objects.create(total=3, status=ImportRun.Status.RUNNING)
+        stale_at = timezone.now() - timedelta(seconds=settings.IMPORT_RUN_STALE_AFTER + 1)
+        ImportRun.objects.filter(pk=stuck.pk).update(updated_at=stale_at)
+        live = ImportRun.objects.create(total=3, status=ImportRun.Status.RUNNING)
+
+        run = PokedexImporter(client=FakePokeAPIClient()).import_range(limit=1)
+
+        stuck.refresh_from_db()
+        self.assertEqual(stuck.status, ImportRun.Status.FAILED)
+        self.assertEqual(stuck.error, 'Interrupted before finishing.')
+        self.assertIsNotNone(stuck.finished_at)
+        live.refresh_from_db()
+        self.assertEqual(live.status, ImportRun.Status.RUNNING)
+        self.assertIsNone(live.finished_at)
+        self.assertEqual(run.status, ImportRun.Status.SUCCEEDED)
+
+
+@override_settings(IMPORT_POKEDEX_ON_STARTUP=True)
+@mock.patch.dict('os.environ', {'RUN_MAIN': 'true'})
+@mock.patch('sys.argv', ['manage.py', 'runserver'])
+class TestStartupImport(SimpleTestCase):
+    """Test cases for the import triggered by `PokedexConfig.ready`."""
+
+    def ready(self):
+        """Run the app config's startup hook."""
+        apps.get_app_config('pokedex').ready()
+
+    @override_settings(IMPORT_POKEDEX_IN_BACKGROUND=True, IMPORT_POKEDEX_LIMIT=7)
+    @mock.patch('pokedex.apps.connections')
+    @mock.patch('pokedex.apps.call_command')
+    def test_background_import_runs_in_daemon_thread(self, call_command, connections):
+        """The import should run in a daemon thread that closes its DB connections."""
+        with mock.patch('pokedex.apps.threading.Thread') as thread:
+            self.ready()
+        thread.assert_called_once()
+        self.assertTrue(thread.call_args.kwargs['daemon'])
+        thread.return_value.start.assert_called_once_with()
+        call_command.assert_not_called()
+
+        thread.call_args.kwargs['target']()
+        call_command.assert_called_once_with('import_pokedex', '--limit=7')
+        connections.close_all.assert_called_once_with()
+
+    @override_settings(IMPORT_POKEDEX_IN_BACKGROUND=False)
+    @mock.patch('pokedex.apps.connections')
+    @mock.patch('pokedex.apps.call_command')
+    def test_foreground_import_blocks_startup(self, call_command, connections):
+        """Without the background setting the import should run before serving."""
+        with mock.patch('pokedex.apps.threading.Thread') as thread:
+            self.ready()
+        thread.assert_not_called()
+        call_command.assert_called_once()
@@ -0,0 +1,88 @@
+"""Tests asserting that the hot queries are served by the intended indexes."""
+from unittest import skipUnless
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from pokedex.models import Ability, Move, Pokemon, PokemonMove, PokemonStat, Stat, Type
+
+
+def explain(sql, params=()):
+    """Return the SQLite query plan details for a statement."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[3] for row in cursor.fetchall()]
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Query plans are asserted for SQLite only.')
+class TestHotQueryIndexes(APITestCase):
+    """Use EXPLAIN QUERY PLAN to check the list and stat queries hit their indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Pokémon with a type, an ability and a stat."""
+        fire = Type.objects.create(name="fire")
+        blaze = Ability.objects.create(name="blaze")
+        speed = Stat.objects.create(name="speed")
+        charmander = Pokemon.objects.create(
+            id=4, name="charmander", height=6, weight=85, base_experience=62
+        )
+        charmander.types.add(fire)
+        charmander.abilities.add(blaze)
+        PokemonStat.objects.create(pokemon=charmander, stat=speed, base_stat=65)
+        ember = Move.objects.create(name="ember")
+        PokemonMove.objects.create(pokemon=charmander, move=ember, learn_method="level-up", level=7)
+
+    def _list_view_plans(self, params):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('api-pokemon-list'), params)
+        self.assertEqual(response.status_code, 200)
+        return [line for query in ctx.captured_queries for line in explain(query['sql'])]
+
+    def test_type_filter_uses_covering_m2m_index(self):
+        """Filtering the list by type should use the (type_id, pokemon_id) index."""
+        plans = self._list_view_plans({'type': 'fire'})
+        self.assertTrue(
+            any('COVERING INDEX pokedex_pokemon_types_type_pokemon_idx' in p for p in plans),
+            plans,
+        )
+
+    def test_ability_filter_uses_covering_m2m_index(self):
+        """Filtering the list by ability should use the (ability_id, pokemon_id) index."""
+        plans = self._list_view_plans({'ability': 'blaze'})
+        self.assertTrue(
+            any('COVERING INDEX pokedex_pokemon_abilities_ability_pokemon_idx' in p for p in plans),
+            plans,
+        )
+
+    def test_redundant_m2m_indexes_are_dropped(self):
+        """The composite M2M indexes replace the single-column type_id/ability_id ones."""
+        with connection.cursor() as cursor:
+            for table, column in (
+                ('pokedex_pokemon_types', 'type_id'),
+                ('pokedex_pokemon_abilities', 'ability_id'),
+            ):
+                indexed = [
+                    info['columns'] for info in
+                    connection.introspection.get_constraints(cursor, table).values()
+                    if info['index']
+                ]
+                self.assertNotIn([column], indexed)
+                self.assertIn([column, 'pokemon_id'], indexed)
+
+    def test_move_filter_uses_covering_index(self):
+        """Filtering the list by move should use the (move_id, pokemon_id) index."""
+        plans = self._list_view_plans({'move': 'ember'})
+        self.assertTrue(
+            any('COVERING INDEX pokemonmove_move_pokemon_idx' in p for p in plans),
+            plans,
+        )
+
+    def test_top_by_stat_uses_stat_base_index(self):
+        """Ordering by one stat should walk the (stat_id, base_stat) index without sorting."""
+        qs = PokemonStat.objects.filter(stat__name='speed').order_by('-base_stat')[:10]
+        plans = explain(*qs.query.sql_with_params())
+        self.assertTrue(any('pokemonstat_stat_base_idx' in p for p in plans), plans)
+        self.assertFalse(any('TEMP B-TREE FOR ORDER BY' in p for p in plans), plans)
@@ -0,0 +1,29 @@
+"""Tests for the Prometheus metrics endpoint."""
+from django.test import TestCase
+from django.urls import reverse
+
+from pokedex.services import PokedexImporter
+
+from .test_importer import FakePokeAPIClient
+
+
+class TestMetricsEndpoint(TestCase):
+    """Test cases for `/metrics`."""
+
+    def test_request_and_import_metrics_are_exposed(self):
+        """Requests and imports should show up in the Prometheus text output."""
+        PokedexImporter(client=FakePokeAPIClient()).import_range(limit=2)
+        self.client.get(reverse('api-type-list'))
+
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn(
+            'pokedex_request_duration_seconds_count{method="GET",status="200",view="api-type-list"}',
+            body,
+        )
+        self.assertIn('pokedex_db_queries_total{view="api-type-list"}', body)
+        self.assertIn('pokedex_import_pokemon_total{result="imported"}', body)
+        self.assertIn('pokedex_import_last_duration_seconds', body)
+        self.assertIn('pokedex_pokeapi_requests_total', body)
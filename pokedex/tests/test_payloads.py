@@ -0,0 +1,76 @@
+"""Tests for pre-encoded detail/compare payloads and the orjson renderer."""
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.urls import reverse
+
+from pokedex.models import DatasetVersion, EvolutionChain, Pokemon, PokemonStat, Stat, Type
+from pokedex.services.payloads import store_payloads
+
+
+class TestStoredPayloads(TestCase):
+    """Test cases for serving stored payloads of the current dataset version."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a two-Pokémon evolution chain with types and stats."""
+        chain = EvolutionChain.objects.create(chain_id=1, stages=EvolutionChain.stages_from_api({
+            'species': {'name': 'flabébé'},
+            'evolves_to': [{'species': {'name': 'floette'}, 'evolves_to': []}],
+        }))
+        fairy = Type.objects.create(name='fairy')
+        hp = Stat.objects.create(name='hp')
+        for pid, name in ((669, 'flabébé'), (670, 'floette')):
+            p = Pokemon.objects.create(
+                id=pid, name=name, height=1, weight=1, base_experience=61, evolution_chain=chain
+            )
+            p.types.set([fairy])
+            PokemonStat.objects.create(pokemon=p, stat=hp, base_stat=pid - 625)
+
+    def dynamic(self, name, *args, **params):
+        """Return the JSON built from model instances, before payloads are stored."""
+        return self.client.get(reverse(name, args=args), params).json()
+
+    def test_stored_payloads_match_dynamic_responses(self):
+        """Stored bodies should be served in one query and equal the dynamically built ones."""
+        detail = self.dynamic('api-pokemon-detail', 670)
+        compare = self.dynamic('api-pokemon-compare', id1=669, id2=670)
+        self.assertEqual(store_payloads(DatasetVersion.bump()), 2)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('api-pokemon-detail', args=[670]))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json(), detail)
+        self.assertEqual(response.json()['evolution'], ['Flabébé', 'Floette'])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('api-pokemon-compare'), {'id1': 669, 'id2': 670}
+            )
+        self.assertEqual(response.json(), compare)
+
+    def test_stale_payloads_are_not_served(self):
+        """After the dataset version moves on, views should rebuild payloads from the models."""
+        store_payloads(DatasetVersion.bump())
+        Pokemon.objects.filter(id=670).update(name='floette-eternal')
+        DatasetVersion.bump()
+
+        data = self.dynamic('api-pokemon-detail', 670)
+        self.assertEqual(data['name'], 'Floette-Eternal')
+
+    async def test_async_views_serve_stored_payloads(self):
+        """The async detail and compare views should serve the same stored bodies."""
+        await DatasetVersion.objects.acreate(version=1)
+        await sync_to_async(store_payloads)(1)
+
+        response = await self.async_client.get(reverse('api-async-pokemon-detail', args=[669]))
+        self.assertEqual(response.json()['name'], 'Flabébé')
+        response = await self.async_client.get(
+            reverse('api-async-pokemon-compare'), {'id1': 669, 'id2': 670}
+        )
+        self.assertEqual(response.json()['pokemon2']['stats'], {'hp': 45})
+
+    def test_renderer_outputs_utf8_json(self):
+        """DRF responses should be rendered by orjson as unescaped UTF-8."""
+        response = self.client.get(reverse('api-pokemon-list'), {'search': 'flab'})
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('Flabébé'.encode(), response.content)
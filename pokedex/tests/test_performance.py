@@ -0,0 +1,120 @@
+"""Tests for the per-request performance instrumentation and SQL query budgets."""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from pokedex.middleware import QueryBudgetExceeded
+from pokedex.models import (
+    Ability,
+    DatasetVersion,
+    EvolutionChain,
+    Pokemon,
+    PokemonStat,
+    Stat,
+    Type,
+)
+from pokedex.services.payloads import store_payloads
+
+BUDGETED_REQUESTS = [
+    ('api-pokemon-list', [], {'type': 'fire', 'ability': 'blaze'}),
+    ('api-pokemon-detail', [4], {}),
+    ('api-pokemon-compare', [], {'id1': 4, 'id2': 5}),
+    ('api-type-list', [], {}),
+    ('api-ability-list', [], {}),
+    ('api-import-status', [], {}),
+    ('api-bootstrap', [], {'limit': 2}),
+]
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class TestQueryBudgets(TestCase):
+    """Every budgeted endpoint must stay within its SQL query budget."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create two Pokémon with several types, abilities and stats each."""
+        types = [Type.objects.create(name=name) for name in ('fire', 'flying', 'dragon')]
+        abilities = [Ability.objects.create(name=name) for name in ('blaze', 'solar-power')]
+        stats = [Stat.objects.create(name=name) for name in ('hp', 'attack', 'speed')]
+        chain = EvolutionChain.objects.create(chain_id=2, stages=[
+            EvolutionChain.stage(4, 'charmander'),
+        ])
+        for pid in (4, 5):
+            p = Pokemon.objects.create(
+                id=pid, name=f'mon-{pid}', height=6, weight=85, base_experience=62,
+                evolution_chain=chain,
+            )
+            p.types.set(types)
+            p.abilities.set(abilities)
+            for stat in stats:
+                PokemonStat.objects.create(pokemon=p, stat=stat, base_stat=pid * 10)
+
+    def setUp(self):
+        """Start without cached compressed responses, so budgets cover the views."""
+        caches[settings.COMPRESSED_RESPONSE_CACHE].clear()
+
+    def test_sync_endpoints_within_budget(self):
+        """DRF endpoints should not exceed their budgets (N+1 queries would raise here)."""
+        for headers in ({}, {'Accept-Encoding': 'gzip'}):
+            for name, args, params in BUDGETED_REQUESTS:
+                with self.subTest(name=name, headers=headers):
+                    response = self.client.get(reverse(name, args=args), params, headers=headers)
+                    self.assertEqual(response.status_code, 200)
+
+    async def test_async_endpoints_within_budget(self):
+        """Async endpoints should not exceed their budgets."""
+        for headers in ({}, {'Accept-Encoding': 'gzip'}):
+            for name, args, params in BUDGETED_REQUESTS:
+                async_name = name.replace('api-', 'api-async-', 1)
+                if async_name not in settings.QUERY_BUDGETS:
+                    continue
+                with self.subTest(name=async_name, headers=headers):
+                    response = await self.async_client.get(
+                        reverse(async_name, args=args), params, headers=headers
+                    )
+                    self.assertEqual(response.status_code, 200)
+
+    def test_compression_shares_dataset_version_lookup(self):
+        """The bootstrap view should reuse the version CompressionMiddleware looked up."""
+        url = reverse('api-bootstrap')
+        with self.assertNumQueries(5):
+            plain = self.client.get(url)
+        with self.assertNumQueries(5):
+            compressed = self.client.get(url, headers={'Accept-Encoding': 'gzip'})
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+
+    def test_server_timing_header(self):
+        """Responses should report query count and per-phase durations in Server-Timing."""
+        response = self.client.get(reverse('api-pokemon-detail', args=[4]))
+        timing = response['Server-Timing']
+        self.assertIn('db;dur=', timing)
+        self.assertIn('desc="4 queries"', timing)
+        for metric in ('view;dur=', 'serialize;dur=', 'total;dur='):
+            self.assertIn(metric, timing)
+
+    async def test_async_server_timing_reports_serialization(self):
+        """Async views time their own JSON encoding; pre-encoded bodies report none."""
+        response = await self.async_client.get(reverse('api-async-pokemon-list'))
+        self.assertRegex(response['Server-Timing'], r'serialize;dur=\d')
+
+        await sync_to_async(store_payloads)(await sync_to_async(DatasetVersion.bump)())
+        response = await self.async_client.get(reverse('api-async-pokemon-detail', args=[4]))
+        self.assertNotIn('serialize;', response['Server-Timing'])
+
+    def test_exceeding_budget(self):
+        """Going over budget should raise in strict mode and only warn otherwise."""
+        budgets = {**settings.QUERY_BUDGETS, 'api-pokemon-compare': 1}
+        with self.settings(QUERY_BUDGETS=budgets):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(reverse('api-pokemon-compare'), {'id1': 4, 'id2': 5})
+
+            with self.settings(QUERY_BUDGET_STRICT=False):
+                with self.assertLogs('pokedex.performance', level='WARNING') as logs:
+                    response = self.client.get(
+                        reverse('api-pokemon-compare'), {'id1': 4, 'id2': 5}
+                    )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('api-pokemon-compare ran 5 SQL queries (budget 1)', logs.output[0])
@@ -0,0 +1,114 @@
+"""Tests for the columnar Pokédex snapshot export."""
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pyarrow as pa
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from pokedex.models import Ability, DatasetVersion, Pokemon, PokemonStat, Stat, Type
+from pokedex.services import PokedexSnapshot
+
+
+class TestPokedexSnapshotAPI(APITestCase):
+    """Test cases for the Arrow IPC snapshot endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create two Pokémon with types, abilities and stats, and a dataset version."""
+        fire = Type.objects.create(name="fire")
+        flying = Type.objects.create(name="flying")
+        blaze = Ability.objects.create(name="blaze")
+        hp = Stat.objects.create(name="hp")
+        speed = Stat.objects.create(name="speed")
+
+        charmander = Pokemon.objects.create(
+            id=4, name="charmander", height=6, weight=85, base_experience=62
+        )
+        charmander.types.add(fire)
+        charmander.abilities.add(blaze)
+        PokemonStat.objects.create(pokemon=charmander, stat=hp, base_stat=39)
+        PokemonStat.objects.create(pokemon=charmander, stat=speed, base_stat=65)
+
+        charizard = Pokemon.objects.create(
+            id=6, name="charizard", height=17, weight=905, base_experience=240
+        )
+        charizard.types.add(fire, flying)
+        charizard.abilities.add(blaze)
+        PokemonStat.objects.create(pokemon=charizard, stat=hp, base_stat=78)
+
+        DatasetVersion.bump()
+
+    def setUp(self):
+        """Point the snapshot store at a temporary directory."""
+        self.snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.snapshot_dir, ignore_errors=True)
+        override = override_settings(SNAPSHOT_DIR=self.snapshot_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def _read_table(self, table):
+        response = self.client.get(reverse('api-snapshot', args=[table]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Dataset-Version'], '1')
+        return pa.ipc.open_file(pa.py_buffer(b''.join(response.streaming_content))).read_all()
+
+    def test_pokemon_table_has_stat_columns(self):
+        """The Pokémon table should have one row per Pokémon and one column per stat."""
+        table = self._read_table('pokemon')
+        self.assertEqual(table.column('id').to_pylist(), [4, 6])
+        self.assertEqual(table.column('hp').to_pylist(), [39, 78])
+        self.assertEqual(table.column('speed').to_pylist(), [65, None])
+
+    def test_types_table_is_exploded(self):
+        """The types table should hold one row per (Pokémon, type) pair."""
+        table = self._read_table('pokemon_types')
+        pairs = list(zip(table.column('pokemon_id').to_pylist(), table.column('type').to_pylist()))
+        self.assertEqual(pairs, [(4, 'fire'), (6, 'fire'), (6, 'flying')])
+
+    def test_snapshot_is_rebuilt_for_new_version(self):
+        """Bumping the dataset version should produce a new snapshot and drop the old one."""
+        self._read_table('pokemon_abilities')
+        DatasetVersion.bump()
+        response = self.client.get(reverse('api-snapshot', args=['pokemon']))
+        self.assertEqual(response['X-Dataset-Version'], '2')
+        response.close()
+        self.assertEqual(
+            sorted(p.name for p in Path(self.snapshot_dir).glob('v*')),
+            ['v2'],
+        )
+
+    def test_older_build_keeps_newer_snapshot(self):
+        """A late build of an older version should not prune a newer snapshot."""
+        snapshot = PokedexSnapshot()
+        snapshot.build(2)
+        snapshot.build(1)
+        self.assertEqual(sorted(p.name for p in Path(self.snapshot_dir).glob('v*')), ['v1', 'v2'])
+
+    def test_snapshot_removed_before_open_is_retried(self):
+        """A snapshot pruned between building and opening should be rebuilt, not fail."""
+        real_open = open
+        calls = []
+
+        def flaky_open(path, *args, **kwargs):
+            if str(path).endswith('.arrow') and not calls:
+                calls.append(path)
+                shutil.rmtree(Path(path).parent)
+            return real_open(path, *args, **kwargs)
+
+        with mock.patch('pokedex.views.snapshot.open', flaky_open, create=True):
+            self._read_table('pokemon')
+        self.assertEqual(len(calls), 1)
+
+        with mock.patch('pokedex.views.snapshot.open', side_effect=FileNotFoundError, create=True):
+            response = self.client.get(reverse('api-snapshot', args=['pokemon']))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    def test_unknown_table_returns_404(self):
+        """Requesting a table that is not part of the snapshot should return 404."""
+        response = self.client.get(reverse('api-snapshot', args=['moves']))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
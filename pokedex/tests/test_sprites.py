@@ -0,0 +1,114 @@
+"""Tests for the local sprite cache and the sprite endpoint."""
+import io
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from pokedex.models import Pokemon
+from pokedex.services import PokedexImporter, SpriteCache
+
+from .test_importer import FakePokeAPIClient
+
+
+def make_png(edge=96, color=(255, 0, 0, 255)):
+    """Return the bytes of a square RGBA PNG image."""
+    buffer = io.BytesIO()
+    Image.new('RGBA', (edge, edge), color).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class SpriteFakePokeAPIClient(FakePokeAPIClient):
+    """Fake client whose Pokémon have sprites that can be downloaded."""
+
+    def get_pokemon(self, pokemon_id):
+        """Return a Pokémon payload with a sprite URL."""
+        data = super().get_pokemon(pokemon_id)
+        data['sprites']['front_default'] = f'https://sprites.test/{pokemon_id}.png'
+        return data
+
+    def fetch_bytes(self, url):
+        """Return a generated sprite image."""
+        return make_png()
+
+
+class TestSpriteCache(TestCase):
+    """Test cases for downloading, thumbnailing and serving sprites."""
+
+    def setUp(self):
+        """Point the sprite cache at a temporary directory."""
+        self.sprite_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.sprite_root, ignore_errors=True)
+        override = override_settings(SPRITE_ROOT=self.sprite_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_import_caches_sprites_and_api_links_them(self):
+        """Importing with a sprite cache should store thumbnails and return local URLs."""
+        importer = PokedexImporter(client=SpriteFakePokeAPIClient(), sprite_cache=SpriteCache())
+        importer.import_range(limit=1)
+
+        pokemon = Pokemon.objects.get(id=1)
+        self.assertTrue(pokemon.sprite_hash)
+        with Image.open(SpriteCache().path_for(1, pokemon.sprite_hash, 'small')) as thumbnail:
+            self.assertEqual(thumbnail.size, (48, 48))
+
+        data = self.client.get(reverse('api-pokemon-detail', args=[1])).json()
+        self.assertEqual(data['sprite_url'], f'/sprites/1/{pokemon.sprite_hash}/original/')
+        self.assertEqual(data['thumbnail_url'], f'/sprites/1/{pokemon.sprite_hash}/small/')
+
+        response = self.client.get(data['thumbnail_url'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        response.close()
+
+    def test_reimport_deletes_unreferenced_sprite_versions(self):
+        """After a publish, only the sprite versions the Pokémon link to should remain."""
+        client = SpriteFakePokeAPIClient()
+        PokedexImporter(client=client, sprite_cache=SpriteCache()).import_range(limit=1)
+        old_hash = Pokemon.objects.get(id=1).sprite_hash
+
+        client.fetch_bytes = lambda url: make_png(color=(0, 0, 255, 255))
+        PokedexImporter(client=client, sprite_cache=SpriteCache()).import_range(limit=1)
+        new_hash = Pokemon.objects.get(id=1).sprite_hash
+
+        self.assertNotEqual(new_hash, old_hash)
+        versions = [p.name for p in (Path(self.sprite_root) / '1').iterdir()]
+        self.assertEqual(versions, [new_hash])
+
+    def test_prune_keeps_versions_written_during_the_import(self):
+        """Versions newer than the cutoff belong to an unpublished import and are kept."""
+        cache = SpriteCache()
+        content_hash = cache.store(1, make_png())
+        self.assertEqual(cache.prune({}, older_than=time.time() - 60), 0)
+        self.assertTrue(cache.path_for(1, content_hash, 'small').exists())
+        self.assertEqual(cache.prune({}), 1)
+        self.assertFalse(cache.path_for(1, content_hash, 'small').exists())
+
+    def test_uncached_sprites_fall_back_to_upstream_and_404(self):
+        """Without a cached sprite the API keeps the upstream URL and the endpoint 404s."""
+        PokedexImporter(client=SpriteFakePokeAPIClient()).import_range(limit=1)
+
+        data = self.client.get(reverse('api-pokemon-detail', args=[1])).json()
+        self.assertEqual(data['sprite_url'], 'https://sprites.test/1.png')
+        self.assertEqual(self.client.get('/sprites/1/0123456789ab/small/').status_code, 404)
+        self.assertEqual(self.client.get('/sprites/1/0123456789ab/huge/').status_code, 404)
+        self.assertEqual(self.client.get('/sprites/1/..%2F..%2Fetc/small/').status_code, 404)
+
+    def test_new_sprite_does_not_change_published_urls(self):
+        """Storing a changed sprite should leave the bytes behind the old URL untouched."""
+        cache = SpriteCache()
+        old_hash = cache.store(1, make_png())
+        old_url = SpriteCache.url_for(1, 'original', old_hash)
+        old_bytes = b''.join(self.client.get(old_url).streaming_content)
+
+        new_hash = cache.store(1, make_png(color=(0, 0, 255, 255)))
+        self.assertNotEqual(new_hash, old_hash)
+        self.assertEqual(b''.join(self.client.get(old_url).streaming_content), old_bytes)
+        new_url = SpriteCache.url_for(1, 'original', new_hash)
+        self.assertNotEqual(b''.join(self.client.get(new_url).streaming_content), old_bytes)
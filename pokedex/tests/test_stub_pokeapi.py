@@ -0,0 +1,52 @@
+"""Tests for importing through the real HTTP client from the local PokéAPI stub."""
+import requests
+from django.test import TestCase
+from prometheus_client import REGISTRY
+
+from pokedex.benchmarks import StubPokeAPI
+from pokedex.models import EvolutionChain, Pokemon
+from pokedex.services import PokeAPIClient, PokedexImporter
+
+
+class TestStubPokeAPI(TestCase):
+    """Test cases for the importer against the stub server."""
+
+    def test_import_from_stub(self):
+        """The importer should import every served Pokémon and time each phase."""
+        with StubPokeAPI(count=6) as stub:
+            client = PokeAPIClient(base_url=stub.api_base)
+            importer = PokedexImporter(client=client)
+            run = importer.import_range()
+
+        self.assertEqual(run.processed, 6)
+        self.assertEqual(Pokemon.objects.count(), 6)
+        self.assertEqual(EvolutionChain.objects.count(), 2)
+        self.assertEqual(set(importer.timings), {'fetch', 'parse', 'sprites', 'write'})
+        self.assertEqual(stub.stats['requests'], client.requests_made)
+
+    def test_client_retries_rate_limits_and_errors(self):
+        """Injected 429 and 503 responses should be retried instead of failing Pokémon."""
+        with StubPokeAPI(count=6, error_rate=0.15, rate_limit_rate=0.15, seed=3) as stub:
+            client = PokeAPIClient(base_url=stub.api_base, max_retries=10, backoff_factor=0)
+            run = PokedexImporter(client=client).import_range()
+
+        self.assertEqual(run.failed, 0)
+        self.assertEqual(Pokemon.objects.count(), 6)
+        self.assertGreater(stub.stats['rate_limited'], 0)
+        self.assertGreater(stub.stats['errors_injected'], 0)
+        self.assertEqual(
+            stub.stats['requests'] - client.requests_made,
+            stub.stats['rate_limited'] + stub.stats['errors_injected'],
+        )
+
+    def test_exhausted_retries_count_only_retries_made(self):
+        """A request failing every attempt should count max_retries retries, not one more."""
+        before = REGISTRY.get_sample_value('pokedex_pokeapi_retries_total')
+        with StubPokeAPI(count=1, error_rate=1.0) as stub:
+            client = PokeAPIClient(base_url=stub.api_base, max_retries=2, backoff_factor=0)
+            with self.assertRaises(requests.RequestException):
+                client.get_total_count()
+
+        self.assertEqual(stub.stats['requests'], 3)
+        after = REGISTRY.get_sample_value('pokedex_pokeapi_retries_total')
+        self.assertEqual(after - before, 2)
@@ -8,10 +8,46 @@ urlpatterns = [
     path('', views.PokedexView.as_view(), name='pokedex-home'),
     path('compare/', views.PokemonCompareView.as_view(), name='pokemon-compare'),
 
+    # Locally cached sprites
+    path(
+        'sprites/<int:id>/<str:content_hash>/<str:size>/',
+        views.PokemonSpriteView.as_view(),
+        name='pokemon-sprite',
+    ),
+
+    # Prometheus metrics
+    path('metrics', views.MetricsView.as_view(), name='metrics'),
+
     # REST API endpoints
+    path('api/bootstrap/', views.BootstrapAPIView.as_view(), name='api-bootstrap'),
     path('api/pokemon/', views.PokemonListAPIView.as_view(), name='api-pokemon-list'),
     path('api/pokemon/<int:id>/', views.PokemonDetailAPIView.as_view(), name='api-pokemon-detail'),
     path('api/pokemon/compare/', views.PokemonCompareAPIView.as_view(), name='api-pokemon-compare'),
     path('api/types/', views.TypeListAPIView.as_view(),    name='api-type-list'),
     path('api/abilities/', views.AbilityListAPIView.as_view(), name='api-ability-list'),
+    path(
+        'api/snapshot/<str:table>.arrow',
+        views.PokedexSnapshotAPIView.as_view(),
+        name='api-snapshot',
+    ),
+    path('api/import/status/', views.ImportStatusAPIView.as_view(), name='api-import-status'),
+
+    # Async read API endpoints, served natively under ASGI (e.g. uvicorn core.asgi:application)
+    path('api/async/pokemon/', views.AsyncPokemonListView.as_view(), name='api-async-pokemon-list'),
+    path(
+        'api/async/pokemon/<int:id>/',
+        views.AsyncPokemonDetailView.as_view(),
+        name='api-async-pokemon-detail',
+    ),
+    path(
+        'api/async/pokemon/compare/',
+        views.AsyncPokemonCompareView.as_view(),
+        name='api-async-pokemon-compare',
+    ),
+    path('api/async/types/', views.AsyncTypeListView.as_view(), name='api-async-type-list'),
+    path(
+        'api/async/abilities/',
+        views.AsyncAbilityListView.as_view(),
+        name='api-async-ability-list',
+    ),
 ]
@@ -1,6 +1,18 @@
 """Import views."""
 
+from .async_api import (
+    AsyncAbilityListView,
+    AsyncPokemonCompareView,
+    AsyncPokemonDetailView,
+    AsyncPokemonListView,
+    AsyncTypeListView,
+)
+from .bootstrap import BootstrapAPIView
 from .compare import PokemonCompareAPIView, PokemonCompareView
 from .detail import PokemonDetailAPIView
 from .filters import AbilityListAPIView, TypeListAPIView
 from .list import PokedexView, PokemonListAPIView
+from .metrics import MetricsView
+from .snapshot import PokedexSnapshotAPIView
+from .sprites import PokemonSpriteView
+from .status import ImportStatusAPIView
@@ -0,0 +1,106 @@
+"""Async read-only API views for serving the Pokédex under an ASGI server."""
+import orjson
+from django.http import HttpResponse
+from django.views import View
+
+from pokedex.middleware import timed_serialization
+from pokedex.models import Ability, Pokemon, Type
+from pokedex.services.payloads import (
+    astored_payloads,
+    compare_payload,
+    compare_queryset,
+    compare_response_body,
+    detail_payload,
+    detail_queryset,
+    summary_payload,
+)
+
+from .list import filter_pokemon
+
+
+def _json(request, data, status=200):
+    with timed_serialization(request):
+        body = orjson.dumps(data)
+    return _json_bytes(body, status=status)
+
+
+def _json_bytes(body, status=200):
+    return HttpResponse(body, status=status, content_type='application/json')
+
+
+class AsyncPokemonListView(View):
+    """Async counterpart of `PokemonListAPIView`."""
+
+    async def get(self, request):
+        """Handle GET requests to retrieve a paginated, filtered list of Pokémon."""
+        page = int(request.GET.get('page', 1))
+        limit = int(request.GET.get('limit', 20))
+        offset = (page - 1) * limit
+
+        qs = filter_pokemon(request.GET)
+        total_count = await qs.acount()
+        results = [summary_payload(p) async for p in qs[offset:offset + limit]]
+        return _json(request, {'results': results, 'count': total_count})
+
+
+class AsyncPokemonDetailView(View):
+    """Async counterpart of `PokemonDetailAPIView`."""
+
+    async def get(self, request, id):
+        """Handle GET request to fetch a Pokémon's details, or 404 if not found."""
+        version = getattr(request, 'dataset_version', None)
+        stored = (await astored_payloads([id], 'detail', version)).get(id)
+        if stored is not None:
+            return _json_bytes(stored)
+
+        try:
+            p = await detail_queryset().aget(id=id)
+        except Pokemon.DoesNotExist:
+            return _json(request, {'detail': 'Not found.'}, status=404)
+        return _json(request, detail_payload(p))
+
+
+class AsyncPokemonCompareView(View):
+    """Async counterpart of `PokemonCompareAPIView`."""
+
+    async def get(self, request):
+        """Handle GET requests to compare two Pokémon given by `id1` and `id2`."""
+        id1 = request.GET.get('id1')
+        id2 = request.GET.get('id2')
+        if not id1 or not id2:
+            return _json(
+                request, {'detail': 'Both id1 and id2 parameters are required.'}, status=400
+            )
+
+        stored = await astored_payloads(
+            [int(id1), int(id2)], 'compare', getattr(request, 'dataset_version', None)
+        )
+        if int(id1) in stored and int(id2) in stored:
+            return _json_bytes(compare_response_body(stored[int(id1)], stored[int(id2)]))
+
+        pokemons = await compare_queryset().ain_bulk([int(id1), int(id2)])
+        p1 = pokemons.get(int(id1))
+        p2 = pokemons.get(int(id2))
+        if p1 is None or p2 is None:
+            return _json(request, {'detail': 'One or both Pokémon not found.'}, status=404)
+        return _json(
+            request, {'pokemon1': compare_payload(p1), 'pokemon2': compare_payload(p2)}
+        )
+
+
+class AsyncTypeListView(View):
+    """Async counterpart of `TypeListAPIView`."""
+
+    async def get(self, request):
+        """Handle GET request to retrieve all types ordered by name."""
+        types = [{'id': t.id, 'name': t.name} async for t in Type.objects.order_by('name')]
+        return _json(request, types)
+
+
+class AsyncAbilityListView(View):
+    """Async counterpart of `AbilityListAPIView`."""
+
+    async def get(self, request):
+        """Handle GET request to retrieve all abilities ordered by name."""
+        abilities = [{'id': a.id, 'name': a.name} async for a in Ability.objects.order_by('name')]
+        return _json(request, abilities)
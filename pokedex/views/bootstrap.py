@@ -0,0 +1,42 @@
+"""View returning everything the Pokédex SPA needs for its first render in one request."""
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from pokedex.models import Ability, DatasetVersion, Pokemon, Type
+from pokedex.services.payloads import summary_payload
+
+
+class BootstrapAPIView(APIView):
+    """API view bundling filter options and the first list page with the dataset version."""
+
+    def get(self, request):
+        """
+        Handle GET request to fetch the SPA bootstrap data.
+
+        Query parameters:
+        - limit (int): size of the first list page (default=20)
+
+        Returns the dataset version, all types and abilities and the first page
+        of the unfiltered Pokémon list (as `GET /api/pokemon/?page=1&limit=<limit>`
+        would). The response carries an ETag derived from the dataset version, so
+        revalidating an unchanged dataset costs one query and an empty 304.
+        """
+        limit = int(request.GET.get('limit', 20))
+        version = DatasetVersion.for_request(request)
+        etag = f'"bootstrap-{version}-{limit}"'
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag in request.headers.get('If-None-Match', ''):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        pokemons = Pokemon.objects.all()
+        data = {
+            'dataset_version': version,
+            'types': [{'id': t.id, 'name': t.name} for t in Type.objects.order_by('name')],
+            'abilities': [{'id': a.id, 'name': a.name} for a in Ability.objects.order_by('name')],
+            'pokemon': {
+                'results': [summary_payload(p) for p in pokemons[:limit]],
+                'count': pokemons.count(),
+            },
+        }
+        return Response(data, status=status.HTTP_200_OK, headers=headers)
@@ -1,10 +1,16 @@
 """Views and API endpoints for comparing Pokémon in the Pokedex application."""
+from django.http import HttpResponse
 from django.views.generic import TemplateView
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from pokedex.models import Pokemon
+from pokedex.services.payloads import (
+    compare_payload,
+    compare_queryset,
+    compare_response_body,
+    stored_payloads,
+)
 
 
 class PokemonCompareAPIView(APIView):
@@ -15,7 +21,8 @@ class PokemonCompareAPIView(APIView):
         Handle GET requests to compare two Pokémon.
 
         - Validates that both `id1` and `id2` parameters are provided.
-        - Fetches each Pokémon or returns 404 if not found.
+        - Joins the pre-encoded payloads of the current dataset version if stored.
+        - Otherwise fetches each Pokémon or returns 404 if not found.
         - Serializes the relevant fields for both Pokémon and returns them.
         """
         id1 = request.GET.get('id1')
@@ -25,30 +32,26 @@ class PokemonCompareAPIView(APIView):
                 {'detail': 'Both id1 and id2 parameters are required.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        try:
-            p1 = Pokemon.objects.get(id=int(id1))
-            p2 = Pokemon.objects.get(id=int(id2))
-        except Pokemon.DoesNotExist:
+        stored = stored_payloads(
+            [int(id1), int(id2)], 'compare', getattr(request, 'dataset_version', None)
+        )
+        if int(id1) in stored and int(id2) in stored:
+            return HttpResponse(
+                compare_response_body(stored[int(id1)], stored[int(id2)]),
+                content_type='application/json',
+            )
+
+        pokemons = compare_queryset().in_bulk([int(id1), int(id2)])
+        p1 = pokemons.get(int(id1))
+        p2 = pokemons.get(int(id2))
+        if p1 is None or p2 is None:
             return Response(
                 {'detail': 'One or both Pokémon not found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        def serialize(p):
-            return {
-                'id': p.id,
-                'name': p.name.title(),
-                'height': p.height,
-                'weight': p.weight,
-                'base_experience': p.base_experience,
-                'types': [t.name for t in p.types.all()],
-                'abilities': [a.name for a in p.abilities.all()],
-                'sprite_url': p.sprite_url,
-                'stats': {ps.stat.name: ps.base_stat for ps in p.pokemonstat_set.all()},
-            }
-
         return Response(
-            {'pokemon1': serialize(p1), 'pokemon2': serialize(p2)},
+            {'pokemon1': compare_payload(p1), 'pokemon2': compare_payload(p2)},
             status=status.HTTP_200_OK
         )
 
@@ -4,7 +4,36 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from pokedex.models import Pokemon
+from pokedex.models import Pokemon, PokemonMove
+from pokedex.services.payloads import summary_payload
+
+
+def filter_pokemon(params):
+    """
+    Return the Pokémon queryset matching the list endpoint's query parameters.
+
+    :param params: QueryDict with optional `search`, `type`, `ability` and `move` parameters.
+    :return: Filtered Pokémon queryset ordered by ID.
+    """
+    search = params.get('search', '').strip()
+    types = params.getlist('type')
+    abilities = params.getlist('ability')
+    moves = params.getlist('move')
+
+    qs = Pokemon.objects.all()
+    if search:
+        qs = qs.filter(name__icontains=search)
+    if types:
+        qs = qs.filter(types__name__in=types)
+    if abilities:
+        qs = qs.filter(abilities__name__in=abilities)
+        qs = qs.distinct()
+    if moves:
+        # A semi-join avoids DISTINCT over the ~100 move rows per Pokémon, which
+        # is costly for moves most Pokémon learn.
+        learners = PokemonMove.objects.filter(move__name__in=moves).values('pokemon_id')
+        qs = qs.filter(id__in=learners)
+    return qs
 
 
 class PokemonListAPIView(APIView):
@@ -20,27 +49,18 @@ class PokemonListAPIView(APIView):
         - search (str): substring to match in Pokémon names
         - type (list of str): filter by Pokémon type names
         - ability (list of str): filter by Pokémon ability names
+        - move (list of str): filter by names of moves the Pokémon can learn
 
         Returns JSON with 'results' (list of {'id', 'name'}) and 'count' (total matches).
         """
         page = int(request.GET.get('page', 1))
         limit = int(request.GET.get('limit', 20))
         offset = (page - 1) * limit
-        search = request.GET.get('search', '').strip()
-        types = request.GET.getlist('type')
-        abilities = request.GET.getlist('ability')
-     
-        qs = Pokemon.objects.all()
-        if search:
-            qs = qs.filter(name__icontains=search)
-        if types:
-            qs = qs.filter(types__name__in=types)
-        if abilities:
-            qs = qs.filter(abilities__name__in=abilities)
-            qs = qs.distinct()
+
+        qs = filter_pokemon(request.GET)
         total_count = qs.count()
         pokemons = qs[offset:offset + limit]
-        results = [{'id': p.id, 'name': p.name.title()} for p in pokemons]
+        results = [summary_payload(p) for p in pokemons]
 
         return Response(
             {'results': results, 'count': total_count},
@@ -0,0 +1,14 @@
+"""View exposing Prometheus metrics for the API and importer."""
+from django.http import HttpResponse
+from django.views import View
+
+from pokedex import metrics
+
+
+class MetricsView(View):
+    """Serve all collected metrics in the Prometheus text exposition format."""
+
+    def get(self, request):
+        """Handle GET request from a Prometheus scraper."""
+        body, content_type = metrics.render_latest()
+        return HttpResponse(body, content_type=content_type)
@@ -0,0 +1,52 @@
+"""Views for downloading columnar snapshots of the Pokédex."""
+from django.http import FileResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from pokedex.models import DatasetVersion
+from pokedex.services import PokedexSnapshot
+
+
+class PokedexSnapshotAPIView(APIView):
+    """API view to download one table of the Pokédex as an Arrow IPC file."""
+
+    def get(self, request, table):
+        """
+        Handle GET request to fetch a snapshot table.
+
+        - Returns 404 for unknown table names.
+        - Builds the snapshot for the current dataset version if it is not cached yet.
+        - Streams the `.arrow` file, tagged with the dataset version.
+        - Returns 503 if the snapshot keeps being replaced by concurrent builds.
+        """
+        if table not in PokedexSnapshot.TABLES:
+            return Response(
+                {'detail': 'Not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        snapshot = PokedexSnapshot()
+        for _attempt in range(2):
+            version = DatasetVersion.current()
+            snapshot.ensure(version)
+            try:
+                fh = open(snapshot.path_for(table, version), 'rb')
+                break
+            except FileNotFoundError:
+                # Pruned by a build of a newer version, or being replaced by a forced rebuild.
+                continue
+        else:
+            return Response(
+                {'detail': 'Snapshot is being rebuilt, try again shortly.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': '1'},
+            )
+        response = FileResponse(
+            fh,
+            as_attachment=True,
+            filename=f"{table}-v{version}.arrow",
+            content_type=PokedexSnapshot.MEDIA_TYPE,
+        )
+        response['X-Dataset-Version'] = str(version)
+        return response
@@ -0,0 +1,29 @@
+"""Views serving locally cached Pokémon sprites."""
+from django.http import FileResponse, Http404
+from django.views import View
+
+from pokedex.services import SpriteCache
+
+
+class PokemonSpriteView(View):
+    """Serve a cached sprite or thumbnail with long-lived, immutable cache headers."""
+
+    def get(self, request, id, content_hash, size):
+        """
+        Handle GET request for a version of a sprite in the given size.
+
+        Returns 404 for unknown sizes, malformed hashes or sprites that were not
+        cached. Files are stored by content hash, so responses can be cached by
+        browsers forever.
+        """
+        if size not in SpriteCache.SIZES:
+            raise Http404('Unknown sprite size.')
+        if not SpriteCache.HASH_PATTERN.fullmatch(content_hash):
+            raise Http404('Unknown sprite version.')
+        try:
+            fh = open(SpriteCache().path_for(id, content_hash, size), 'rb')
+        except FileNotFoundError:
+            raise Http404('Sprite not cached.') from None
+        response = FileResponse(fh, content_type='image/png')
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
@@ -0,0 +1,38 @@
+"""Views for reporting the state of the Pokédex dataset and its importer."""
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from pokedex.models import DatasetVersion, ImportRun, Pokemon
+
+
+class ImportStatusAPIView(APIView):
+    """API view reporting the published dataset version and the latest import run."""
+
+    def get(self, request):
+        """
+        Handle GET request to fetch the import status.
+
+        Returns the current dataset version, the number of published Pokémon
+        and the progress of the most recent import run (or null if none ran).
+        """
+        run = ImportRun.objects.first()
+        data = {
+            'dataset_version': DatasetVersion.current(),
+            'pokemon_count': Pokemon.objects.count(),
+            'import': None,
+        }
+        if run:
+            data['import'] = {
+                'id': run.id,
+                'status': run.status,
+                'total': run.total,
+                'processed': run.processed,
+                'failed': run.failed,
+                'progress': run.progress,
+                'dataset_version': run.dataset_version,
+                'error': run.error,
+                'started_at': run.started_at,
+                'finished_at': run.finished_at,
+            }
+        return Response(data, status=status.HTTP_200_OK)